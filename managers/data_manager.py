@@ -20,10 +20,16 @@ from felgenland_cleanup import FelgenlandCleanup
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 from templates.data_templates import (
     StarTemplate, NationTemplate, TradeRouteTemplate, 
-    PlanetarySystemTemplate, StellarRegionTemplate, EXAMPLE_TEMPLATES
+    PlanetarySystemTemplate, StellarRegionTemplate, get_example_templates
 )
 
 
+def _as_dict(data):
+    """Dict form of a template record; plain dicts pass through unchanged"""
+    as_dict = getattr(data, 'as_dict', None)
+    return data if as_dict is None else as_dict()
+
+
 class DataManager:
     """Unified interface for all data management operations"""
     
@@ -39,13 +45,13 @@ class DataManager:
     # =================
     
     def add_star(self, star_data: Dict) -> int:
-        """Add a new star to the database"""
-        return self.star_manager.add_star(star_data)
+        """Add a new star (dict or StarTemplate record) to the database"""
+        return self.star_manager.add_star(_as_dict(star_data))
     
     def add_star_from_template(self, template_type: str, **kwargs) -> int:
         """Add a star using a template"""
         if template_type == 'basic':
-            star_data = StarTemplate.create_basic_star(**kwargs)
+            star_data = StarTemplate.create_basic_star_dict(**kwargs)
         elif template_type == 'fictional':
             star_data = StarTemplate.create_fictional_star(**kwargs)
         else:
@@ -78,17 +84,17 @@ class DataManager:
     # =================
     
     def add_nation(self, nation_data: Dict) -> str:
-        """Add a new nation to the database"""
-        return self.nation_manager.add_nation(nation_data)
+        """Add a new nation (dict or NationTemplate record) to the database"""
+        return self.nation_manager.add_nation(_as_dict(nation_data))
     
     def add_nation_from_template(self, template_type: str, **kwargs) -> str:
         """Add a nation using a template"""
         if template_type == 'basic':
-            nation_data = NationTemplate.create_nation(**kwargs)
+            nation_data = NationTemplate.create_nation(**kwargs).as_dict()
         elif template_type == 'confederation':
-            nation_data = NationTemplate.create_trading_confederation(**kwargs)
+            nation_data = NationTemplate.create_trading_confederation(**kwargs).as_dict()
         elif template_type == 'coalition':
-            nation_data = NationTemplate.create_exploration_coalition(**kwargs)
+            nation_data = NationTemplate.create_exploration_coalition(**kwargs).as_dict()
         else:
             raise ValueError(f"Unknown nation template type: {template_type}")
         
@@ -127,17 +133,17 @@ class DataManager:
     # =================
     
     def add_trade_route(self, route_data: Dict) -> str:
-        """Add a new trade route"""
-        return self.trade_route_manager.add_trade_route(route_data)
+        """Add a new trade route (dict or TradeRouteTemplate record)"""
+        return self.trade_route_manager.add_trade_route(_as_dict(route_data))
     
     def add_trade_route_from_template(self, template_type: str, **kwargs) -> str:
         """Add a trade route using a template"""
         if template_type == 'basic':
-            route_data = TradeRouteTemplate.create_trade_route(**kwargs)
+            route_data = TradeRouteTemplate.create_trade_route(**kwargs).as_dict()
         elif template_type == 'mining':
-            route_data = TradeRouteTemplate.create_mining_route(**kwargs)
+            route_data = TradeRouteTemplate.create_mining_route(**kwargs).as_dict()
         elif template_type == 'passenger':
-            route_data = TradeRouteTemplate.create_passenger_route(**kwargs)
+            route_data = TradeRouteTemplate.create_passenger_route(**kwargs).as_dict()
         else:
             raise ValueError(f"Unknown trade route template type: {template_type}")
         
@@ -195,8 +201,8 @@ class DataManager:
         return self.system_manager.list_planetary_systems(**kwargs)
     
     def add_planet_to_system(self, star_id: int, planet_data: Dict) -> bool:
-        """Add a planet to a system"""
-        return self.system_manager.add_planet_to_system(star_id, planet_data)
+        """Add a planet (dict or PlanetarySystemTemplate record) to a system"""
+        return self.system_manager.add_planet_to_system(star_id, _as_dict(planet_data))
     
     def update_planetary_system(self, star_id: int, update_data: Dict) -> bool:
         """Update planetary system information"""
@@ -240,11 +246,11 @@ class DataManager:
     
     def bulk_add_stars(self, stars_data: List[Dict]) -> List[int]:
         """Add multiple stars"""
-        return self.star_manager.add_star_batch(stars_data)
+        return self.star_manager.add_star_batch([_as_dict(star) for star in stars_data])
     
     def bulk_add_trade_routes(self, routes_data: List[Dict]) -> List[str]:
         """Add multiple trade routes"""
-        return self.trade_route_manager.add_trade_route_batch(routes_data)
+        return self.trade_route_manager.add_trade_route_batch([_as_dict(route) for route in routes_data])
     
     def import_stars_from_csv(self, csv_file: str) -> int:
         """Import stars from CSV file"""
@@ -264,7 +270,7 @@ class DataManager:
     
     def get_templates(self) -> Dict:
         """Get all available templates"""
-        return EXAMPLE_TEMPLATES
+        return get_example_templates()
     
     def create_from_template(self, data_type: str, template_type: str, **kwargs) -> Union[int, str]:
         """Create data from template"""
@@ -285,19 +291,19 @@ class DataManager:
     
     def validate_star_data(self, star_data: Dict) -> List[str]:
         """Validate star data"""
-        return self.star_manager.validate_star_data(star_data)
+        return self.star_manager.validate_star_data(_as_dict(star_data))
     
     def validate_nation_data(self, nation_data: Dict) -> List[str]:
         """Validate nation data"""
-        return self.nation_manager.validate_nation_data(nation_data)
+        return self.nation_manager.validate_nation_data(_as_dict(nation_data))
     
     def validate_trade_route_data(self, route_data: Dict) -> List[str]:
         """Validate trade route data"""
-        return self.trade_route_manager.validate_trade_route_data(route_data)
+        return self.trade_route_manager.validate_trade_route_data(_as_dict(route_data))
     
     def validate_planet_data(self, planet_data: Dict) -> List[str]:
         """Validate planet data"""
-        return self.system_manager.validate_planet_data(planet_data)
+        return self.system_manager.validate_planet_data(_as_dict(planet_data))
     
     # =================
     # ANALYSIS OPERATIONS
@@ -529,7 +535,7 @@ def get_data_manager() -> DataManager:
 def quick_add_star(name: str, x: float, y: float, z: float, magnitude: float, spectral_class: str) -> int:
     """Quick function to add a basic star"""
     dm = DataManager()
-    star_data = StarTemplate.create_basic_star(
+    star_data = StarTemplate.create_basic_star_dict(
         star_id=900000 + hash(name) % 100000,  # Generate unique ID
         name=name, x=x, y=y, z=z, magnitude=magnitude, spectral_class=spectral_class
     )
@@ -548,7 +554,7 @@ def quick_add_nation(name: str, government_type: str, capital_star_id: int) -> s
         capital_star_id=capital_star_id,
         capital_planet="Capital World",
         established_year=2350
-    )
+    ).as_dict()
     return dm.add_nation(nation_data)
 
 
@@ -596,7 +596,7 @@ class TradeRouteManager:
         
         # Validate cargo types
         if 'cargo_types' in route_data:
-            if not isinstance(route_data['cargo_types'], list):
+            if not isinstance(route_data['cargo_types'], (list, tuple)):
                 errors.append("Cargo types must be a list")
             elif not all(isinstance(ct, str) for ct in route_data['cargo_types']):
                 errors.append("All cargo types must be strings")
@@ -1,6 +1,7 @@
 import pandas as pd
 import math
 import os
+from types import MappingProxyType
 from .base_model import BaseModel
 from star_naming import StarNamingSystem
 from fictional_names import fictional_star_names
@@ -18,6 +19,7 @@ class StarModel(BaseModel):
         self._cache = {}
         self._filtered_cache = {}
         self._search_cache = {}
+        self._search_blob = None
         super().__init__()
     
     def load_data(self):
@@ -49,6 +51,7 @@ class StarModel(BaseModel):
             # Process star names using the naming system
             print("Processing star names...")
             self.data = self.naming_system.process_star_dataframe(self.data)
+            self._build_search_blob()
             print("Star naming complete")
             
             # Add fictional names and nation data
@@ -62,6 +65,15 @@ class StarModel(BaseModel):
             print(f"Error loading star data: {e}")
             self.data = pd.DataFrame()
     
+    def _build_search_blob(self):
+        """Precompute the lower-cased name text that search_stars matches against"""
+        if self.data.empty:
+            self._search_blob = None
+            return
+        
+        # Kept beside self.data rather than as a column so it never reaches exports
+        self._search_blob = self.naming_system.build_search_blob(self.data)
+    
     def _add_fictional_data(self):
         """Add fictional names from the fictional names database"""
         def get_fictional_name(star_id):
@@ -100,20 +112,33 @@ class StarModel(BaseModel):
     
     def _add_nation_data(self):
         """Add nation control data to stars"""
+        summaries = {}
+        
         def get_nation_for_star(star_id):
             nation_id = get_star_nation(star_id)
-            nation_info = get_nation_info(nation_id)
-            if nation_info is None:
-                return None
-            return {
-                'id': nation_id,
-                'name': nation_info['name'],
-                'color': nation_info['color'],
-                'government_type': nation_info['government_type']
-            }
+            if nation_id not in summaries:
+                summaries[nation_id] = self._nation_summary(nation_id)
+            return summaries[nation_id]
         
         self.data['nation'] = self.data['id'].apply(get_nation_for_star)
     
+    @staticmethod
+    def _nation_summary(nation_id):
+        """Compact read-only nation record attached to each star, or None if uncontrolled
+        
+        One summary is shared by every star of a nation, so it is returned as
+        a MappingProxyType; copy it with dict() before changing or serializing.
+        """
+        nation_info = get_nation_info(nation_id)
+        if nation_info is None:
+            return None
+        return MappingProxyType({
+            'id': nation_id,
+            'name': nation_info['name'],
+            'color': nation_info['color'],
+            'government_type': nation_info['government_type']
+        })
+    
     def _add_habitability_data(self):
         """Add habitability assessment data to stars"""
         print("Calculating habitability scores...")
@@ -220,22 +245,19 @@ class StarModel(BaseModel):
     def _format_stars_for_json(self, stars_df):
         """Convert star dataframe to JSON-serializable format"""
         stars_json = []
+        nation_summaries = {}
         
         for _, star in stars_df.iterrows():
             star_id = int(star['id'])
             
-            # Always get fresh nation data to avoid pandas string conversion
+            # Always get fresh nation data to avoid pandas string conversion;
+            # the summary is looked up once per nation and copied per star
+            # into a plain dict so the JSON output is serializable and owned
             nation_id = get_star_nation(star_id)
-            nation_info = get_nation_info(nation_id)
-            if nation_info is not None:
-                nation_data = {
-                    'id': nation_id,
-                    'name': nation_info['name'],
-                    'color': nation_info['color'],
-                    'government_type': nation_info['government_type']
-                }
-            else:
-                nation_data = None
+            if nation_id not in nation_summaries:
+                nation_summaries[nation_id] = self._nation_summary(nation_id)
+            nation_summary = nation_summaries[nation_id]
+            nation_data = dict(nation_summary) if nation_summary is not None else None
             
             # Get planet data if available
             planets = star.get('planets', [])
@@ -349,7 +371,7 @@ class StarModel(BaseModel):
         
         if query:
             # Use the naming system to search by name
-            results = self.naming_system.search_stars_by_name(self.data, query)
+            results = self.naming_system.search_stars_by_name(self.data, query, self._search_blob)
             
             # Also search fictional names efficiently
             fictional_matches = self.data[
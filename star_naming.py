@@ -4,40 +4,226 @@ Star Naming System for Starmap Application
 Provides hierarchical naming with preference for common names and constellation identifiers
 """
 
+import functools
+from collections import namedtuple
+
+import numpy as np
 import pandas as pd
 import re
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings keep each column in one contiguous buffer and route
+    # .str operations to Arrow compute kernels
+    NAMING_STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    NAMING_STRING_DTYPE = 'string'
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Catalog columns consulted when naming a star
+NAMING_FIELDS = ('proper', 'bayer', 'flam', 'con', 'bf', 'hip', 'gl', 'hd', 'var', 'comp')
+
+# Naming result for a single star; fields double as the columns added by
+# StarNamingSystem.process_star_dataframe
+StarNaming = namedtuple('StarNaming', 'primary_name all_names catalog_ids constellation_short '
+                                      'constellation_full has_proper_name designation_type')
+NAMING_COLUMNS = list(StarNaming._fields)
+
+CONSTELLATION_NAMES = {
+    'And': 'Andromedae', 'Ant': 'Antliae', 'Aps': 'Apodis', 'Aqr': 'Aquarii', 'Aql': 'Aquilae',
+    'Ara': 'Arae', 'Ari': 'Arietis', 'Aur': 'Aurigae', 'Boo': 'Boötis', 'Cae': 'Caeli',
+    'Cam': 'Camelopardalis', 'Cnc': 'Cancri', 'CVn': 'Canum Venaticorum', 'CMa': 'Canis Majoris',
+    'CMi': 'Canis Minoris', 'Cap': 'Capricorni', 'Car': 'Carinae', 'Cas': 'Cassiopeiae',
+    'Cen': 'Centauri', 'Cep': 'Cephei', 'Cet': 'Ceti', 'Cha': 'Chamaeleontis', 'Cir': 'Circini',
+    'Col': 'Columbae', 'Com': 'Comae Berenices', 'CrA': 'Coronae Australis', 'CrB': 'Coronae Borealis',
+    'Crv': 'Corvi', 'Crt': 'Crateris', 'Cru': 'Crucis', 'Cyg': 'Cygni', 'Del': 'Delphini',
+    'Dor': 'Doradus', 'Dra': 'Draconis', 'Equ': 'Equulei', 'Eri': 'Eridani', 'For': 'Fornacis',
+    'Gem': 'Geminorum', 'Gru': 'Gruis', 'Her': 'Herculis', 'Hor': 'Horologii', 'Hya': 'Hydrae',
+    'Hyi': 'Hydri', 'Ind': 'Indi', 'Lac': 'Lacertae', 'Leo': 'Leonis', 'LMi': 'Leonis Minoris',
+    'Lep': 'Leporis', 'Lib': 'Librae', 'Lup': 'Lupi', 'Lyn': 'Lyncis', 'Lyr': 'Lyrae',
+    'Men': 'Mensae', 'Mic': 'Microscopii', 'Mon': 'Monocerotis', 'Mus': 'Muscae', 'Nor': 'Normae',
+    'Oct': 'Octantis', 'Oph': 'Ophiuchi', 'Ori': 'Orionis', 'Pav': 'Pavonis', 'Peg': 'Pegasi',
+    'Per': 'Persei', 'Phe': 'Phoenicis', 'Pic': 'Pictoris', 'Psc': 'Piscium', 'PsA': 'Piscis Austrini',
+    'Pup': 'Puppis', 'Pyx': 'Pyxidis', 'Ret': 'Reticuli', 'Sge': 'Sagittae', 'Sgr': 'Sagittarii',
+    'Sco': 'Scorpii', 'Scl': 'Sculptoris', 'Sct': 'Scuti', 'Ser': 'Serpentis', 'Sex': 'Sextantis',
+    'Tau': 'Tauri', 'Tel': 'Telescopii', 'Tri': 'Trianguli', 'TrA': 'Trianguli Australis',
+    'Tuc': 'Tucanae', 'UMa': 'Ursa Majoris', 'UMi': 'Ursa Minoris', 'Vel': 'Velorum',
+    'Vir': 'Virginis', 'Vol': 'Volantis', 'Vul': 'Vulpeculae'
+}
+
+GREEK_LETTERS = {
+    'Alp': 'α', 'Bet': 'β', 'Gam': 'γ', 'Del': 'δ', 'Eps': 'ε', 'Zet': 'ζ', 'Eta': 'η', 'The': 'θ',
+    'Iot': 'ι', 'Kap': 'κ', 'Lam': 'λ', 'Mu': 'μ', 'Nu': 'ν', 'Xi': 'ξ', 'Omi': 'ο', 'Pi': 'π',
+    'Rho': 'ρ', 'Sig': 'σ', 'Tau': 'τ', 'Ups': 'υ', 'Phi': 'φ', 'Chi': 'χ', 'Psi': 'ψ', 'Ome': 'ω'
+}
+
+
+def _format_int_or_empty(value) -> str:
+    """Format a catalog number as an integer string ('32349.0' -> '32349'), '' when missing"""
+    if isinstance(value, (int, np.integer)):
+        return f'{value:d}'
+    if isinstance(value, (float, np.floating)):
+        return '' if np.isnan(value) else f'{int(value):d}'
+    if not value:
+        return ''
+    return f'{int(float(value)):d}' if '.' in value else value
+
+
+def _constellation_designation(bayer: str, flamsteed: str, constellation: str, component: str = '') -> str:
+    """Format a proper constellation designation like '20 LMi' or 'α Cen A'"""
+    if not constellation:
+        return ''
+        
+    # Handle component designation (A, B, etc.)
+    comp_suffix = f' {component}' if component and component not in ['1', ''] else ''
+    
+    # Prefer Flamsteed number if available
+    if flamsteed and flamsteed != '0.0':
+        return f'{_format_int_or_empty(flamsteed)} {constellation}{comp_suffix}'
+    
+    # Use Bayer designation with Greek letter
+    elif bayer:
+        # Clean up Bayer designation
+        bayer_clean = bayer.replace('-1', '').replace('-2', '')
+        greek_letter = GREEK_LETTERS.get(bayer_clean, bayer_clean)
+        return f'{greek_letter} {constellation}{comp_suffix}'
+        
+    return ''
+
+
+def _designation_type(proper: str, constellation_name: str, hip: str, gliese: str) -> str:
+    """Determine the type of the primary designation"""
+    if proper:
+        return 'proper'
+    elif constellation_name:
+        return 'constellation'
+    elif hip and hip != '0.0':
+        return 'hipparcos'
+    elif gliese:
+        return 'gliese'
+    else:
+        return 'catalog'
+
+
+@functools.lru_cache(maxsize=200_000)
+def _name_from_fields(proper: str, bayer: str, flamsteed: str, constellation: str, bf_combined: str,
+                      hip: str, gliese: str, hd: str, var_name: str, component: str, star_id) -> StarNaming:
+    """Build the naming hierarchy for one star from its cleaned catalog fields.
+
+    Pure and memoized, so repeat lookups of the same star skip the string work.
+    Lists are returned as tuples so cached results cannot be mutated by callers.
+    """
+    # Build naming hierarchy
+    names = []
+    identifiers = []
+    
+    # 1. Proper name (highest priority)
+    if proper:
+        names.append(proper)
+        if component and component not in ['1', '']:
+            names[0] = f'{proper} {component}'
+    
+    # 2. Variable star designation
+    if var_name:
+        var_full = f'{var_name} {constellation}' if constellation else var_name
+        identifiers.append(var_full)
+    
+    # 3. Bayer/Flamsteed combined designation
+    if bf_combined:
+        # Parse combined designation like "9Alp CMa" or "18Eps Eri"
+        bf_parts = bf_combined.split()
+        if len(bf_parts) >= 2:
+            names.append(bf_combined)
+    
+    # 4. Individual constellation designation
+    constellation_name = _constellation_designation(bayer, flamsteed, constellation, component)
+    if constellation_name and constellation_name not in names:
+        names.append(constellation_name)
+    
+    # 5. Catalog numbers (fallbacks)
+    if hip and hip != '0.0':
+        identifiers.append(f'HIP {_format_int_or_empty(hip)}')
+    
+    if gliese:
+        # Clean up Gliese designation
+        gliese_clean = gliese.replace('Gl ', '').strip()
+        if gliese_clean:
+            identifiers.append(f'Gliese {gliese_clean}')
+    
+    if hd and hd != '0.0':
+        identifiers.append(f'HD {_format_int_or_empty(hd)}')
+    
+    # 6. Fallback to star ID
+    if not names and not identifiers:
+        names.append(f'Star {star_id}')
+    
+    # Choose primary name
+    primary_name = names[0] if names else (identifiers[0] if identifiers else f'Star {star_id}')
+    
+    # Create full constellation name for description
+    constellation_full = CONSTELLATION_NAMES.get(constellation, constellation) if constellation else ''
+    
+    return StarNaming(primary_name, tuple(names), tuple(identifiers), constellation, constellation_full,
+                      bool(proper), _designation_type(proper, constellation_name, hip, gliese))
+
+
+def _build_name_lists(star_ids, proper_names, bf_names, constellation_names,
+                      var_ids, hip_ids, gliese_ids, hd_ids) -> Tuple[List, List, List]:
+    """Assemble the per-star name and identifier lists from aligned candidate arrays.
+
+    Each array holds one candidate designation per star ('' where the star has
+    none), so the loop body is plain truthiness tests and list appends.
+    """
+    primary_names = []
+    all_names = []
+    catalog_ids = []
+    add_primary = primary_names.append
+    add_names = all_names.append
+    add_identifiers = catalog_ids.append
+    
+    for star_id, proper_name, bf_name, constellation_name, var_id, hip_id, gliese_id, hd_id in zip(
+            star_ids, proper_names, bf_names, constellation_names, var_ids, hip_ids, gliese_ids, hd_ids):
+        names = []
+        if proper_name:
+            names.append(proper_name)
+        if bf_name:
+            names.append(bf_name)
+        if constellation_name and constellation_name != proper_name and constellation_name != bf_name:
+            names.append(constellation_name)
+        
+        identifiers = []
+        if var_id:
+            identifiers.append(var_id)
+        if hip_id:
+            identifiers.append(hip_id)
+        if gliese_id:
+            identifiers.append(gliese_id)
+        if hd_id:
+            identifiers.append(hd_id)
+        
+        if names:
+            add_primary(names[0])
+        elif identifiers:
+            add_primary(identifiers[0])
+        else:
+            names.append(f'Star {star_id}')
+            add_primary(names[0])
+        add_names(names)
+        add_identifiers(identifiers)
+    
+    return primary_names, all_names, catalog_ids
+
+
 class StarNamingSystem:
     def __init__(self):
         """Initialize the star naming system"""
-        self.constellation_names = {
-            'And': 'Andromedae', 'Ant': 'Antliae', 'Aps': 'Apodis', 'Aqr': 'Aquarii', 'Aql': 'Aquilae',
-            'Ara': 'Arae', 'Ari': 'Arietis', 'Aur': 'Aurigae', 'Boo': 'Boötis', 'Cae': 'Caeli',
-            'Cam': 'Camelopardalis', 'Cnc': 'Cancri', 'CVn': 'Canum Venaticorum', 'CMa': 'Canis Majoris',
-            'CMi': 'Canis Minoris', 'Cap': 'Capricorni', 'Car': 'Carinae', 'Cas': 'Cassiopeiae',
-            'Cen': 'Centauri', 'Cep': 'Cephei', 'Cet': 'Ceti', 'Cha': 'Chamaeleontis', 'Cir': 'Circini',
-            'Col': 'Columbae', 'Com': 'Comae Berenices', 'CrA': 'Coronae Australis', 'CrB': 'Coronae Borealis',
-            'Crv': 'Corvi', 'Crt': 'Crateris', 'Cru': 'Crucis', 'Cyg': 'Cygni', 'Del': 'Delphini',
-            'Dor': 'Doradus', 'Dra': 'Draconis', 'Equ': 'Equulei', 'Eri': 'Eridani', 'For': 'Fornacis',
-            'Gem': 'Geminorum', 'Gru': 'Gruis', 'Her': 'Herculis', 'Hor': 'Horologii', 'Hya': 'Hydrae',
-            'Hyi': 'Hydri', 'Ind': 'Indi', 'Lac': 'Lacertae', 'Leo': 'Leonis', 'LMi': 'Leonis Minoris',
-            'Lep': 'Leporis', 'Lib': 'Librae', 'Lup': 'Lupi', 'Lyn': 'Lyncis', 'Lyr': 'Lyrae',
-            'Men': 'Mensae', 'Mic': 'Microscopii', 'Mon': 'Monocerotis', 'Mus': 'Muscae', 'Nor': 'Normae',
-            'Oct': 'Octantis', 'Oph': 'Ophiuchi', 'Ori': 'Orionis', 'Pav': 'Pavonis', 'Peg': 'Pegasi',
-            'Per': 'Persei', 'Phe': 'Phoenicis', 'Pic': 'Pictoris', 'Psc': 'Piscium', 'PsA': 'Piscis Austrini',
-            'Pup': 'Puppis', 'Pyx': 'Pyxidis', 'Ret': 'Reticuli', 'Sge': 'Sagittae', 'Sgr': 'Sagittarii',
-            'Sco': 'Scorpii', 'Scl': 'Sculptoris', 'Sct': 'Scuti', 'Ser': 'Serpentis', 'Sex': 'Sextantis',
-            'Tau': 'Tauri', 'Tel': 'Telescopii', 'Tri': 'Trianguli', 'TrA': 'Trianguli Australis',
-            'Tuc': 'Tucanae', 'UMa': 'Ursa Majoris', 'UMi': 'Ursa Minoris', 'Vel': 'Velorum',
-            'Vir': 'Virginis', 'Vol': 'Volantis', 'Vul': 'Vulpeculae'
-        }
-        
-        self.greek_letters = {
-            'Alp': 'α', 'Bet': 'β', 'Gam': 'γ', 'Del': 'δ', 'Eps': 'ε', 'Zet': 'ζ', 'Eta': 'η', 'The': 'θ',
-            'Iot': 'ι', 'Kap': 'κ', 'Lam': 'λ', 'Mu': 'μ', 'Nu': 'ν', 'Xi': 'ξ', 'Omi': 'ο', 'Pi': 'π',
-            'Rho': 'ρ', 'Sig': 'σ', 'Tau': 'τ', 'Ups': 'υ', 'Phi': 'φ', 'Chi': 'χ', 'Psi': 'ψ', 'Ome': 'ω'
-        }
+        self.constellation_names = CONSTELLATION_NAMES
+        self.greek_letters = GREEK_LETTERS
 
     def clean_value(self, value) -> str:
         """Clean and normalize a value from the CSV"""
@@ -48,151 +234,276 @@ class StarNamingSystem:
     def format_constellation_designation(self, bayer: str, flamsteed: str, constellation: str, 
                                       component: str = '') -> str:
         """Format a proper constellation designation like '20 LMi' or 'α Cen A'"""
-        if not constellation:
-            return ''
-            
-        # Handle component designation (A, B, etc.)
-        comp_suffix = f' {component}' if component and component not in ['1', ''] else ''
-        
-        # Prefer Flamsteed number if available
-        if flamsteed and flamsteed != '0.0':
-            flamsteed_num = str(int(float(flamsteed))) if '.' in str(flamsteed) else str(flamsteed)
-            return f'{flamsteed_num} {constellation}{comp_suffix}'
-        
-        # Use Bayer designation with Greek letter
-        elif bayer:
-            # Clean up Bayer designation
-            bayer_clean = bayer.replace('-1', '').replace('-2', '')
-            greek_letter = self.greek_letters.get(bayer_clean, bayer_clean)
-            return f'{greek_letter} {constellation}{comp_suffix}'
-            
-        return ''
+        return _constellation_designation(bayer, flamsteed, constellation, component)
+
+    def _naming_for_row(self, star_row: pd.Series) -> StarNaming:
+        """Clean a catalog row and look up its (memoized) naming tuple"""
+        return _name_from_fields(
+            self.clean_value(star_row.get('proper', '')),
+            self.clean_value(star_row.get('bayer', '')),
+            self.clean_value(star_row.get('flam', '')),
+            self.clean_value(star_row.get('con', '')),
+            self.clean_value(star_row.get('bf', '')),
+            self.clean_value(star_row.get('hip', '')),
+            self.clean_value(star_row.get('gl', '')),
+            self.clean_value(star_row.get('hd', '')),
+            self.clean_value(star_row.get('var', '')),
+            self.clean_value(star_row.get('comp', '')),
+            star_row.get('id', 0)
+        )
 
     def generate_star_name(self, star_row: pd.Series) -> Dict[str, str]:
         """Generate comprehensive naming information for a star"""
+        naming = self._naming_for_row(star_row)
+        star_naming = naming._asdict()
+        star_naming['all_names'] = list(naming.all_names)
+        star_naming['catalog_ids'] = list(naming.catalog_ids)
+        return star_naming
+    
+    def _get_designation_type(self, primary_name: str, proper: str, constellation_name: str, 
+                            hip: str, gliese: str) -> str:
+        """Determine the type of the primary designation"""
+        return _designation_type(proper, constellation_name, hip, gliese)
+
+    def _prepare_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize the catalog fields used for naming in a single pass.
+
+        Column-level equivalent of clean_value: missing values, 'Null' and
+        blanks all become ''. Columns are held as NAMING_STRING_DTYPE (Arrow
+        backed when pyarrow is installed) so the follow-on .str operations
+        run over typed string storage.
+        """
+        prepared = pd.DataFrame(index=df.index)
+        for column in NAMING_FIELDS:
+            if column in df.columns:
+                values = df[column].astype(NAMING_STRING_DTYPE).fillna('').str.strip()
+                prepared[column] = values.replace({'Null': '', 'nan': ''})
+            else:
+                prepared[column] = pd.Series('', index=df.index, dtype=NAMING_STRING_DTYPE)
+        return prepared
+
+    def _format_catalog_number(self, values: pd.Series) -> pd.Series:
+        """Render float-like catalog numbers ('32349.0') as integers ('32349')"""
+        has_dot = values.str.contains('.', regex=False)
+        numbers = pd.to_numeric(values.where(has_dot), errors='coerce').dropna()
+        return values.mask(values.index.isin(numbers.index), numbers.astype('int64').astype(str))
+
+    def _lookup_categorical(self, values: pd.Series, lookup: Dict[str, str]) -> pd.Series:
+        """Map a column through a small lookup table using categorical codes.
+
+        Values missing from the table pass through unchanged, like ``lookup.get(v, v)``.
+        """
+        categories = list(lookup.keys())
+        codes = pd.Categorical(values, categories=categories).codes
+        table = np.array([lookup[key] for key in categories] + [''], dtype=object)
+        return pd.Series(table.take(codes), index=values.index).where(codes >= 0, values)
+
+    def process_star_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process entire dataframe to add naming information.
+
+        Mirrors generate_star_name, but works a column at a time instead of
+        building a Series per row.
+        """
+        fields = self._prepare_frame(df)
+        proper = fields['proper']
+        bayer = fields['bayer']
+        flamsteed = fields['flam']
+        constellation = fields['con']
+        bf_combined = fields['bf']
+        hip = fields['hip']
+        gliese = fields['gl']
+        hd = fields['hd']
+        var_name = fields['var']
+        component = fields['comp']
+        star_ids = df['id'].astype(str) if 'id' in df.columns else pd.Series('0', index=df.index)
+
+        has_proper = (proper != '').to_numpy(bool)
+        has_constellation = constellation != ''
+        comp_suffix = (' ' + component).where(~component.isin(['1', '']), '')
+
+        # Candidate names, '' where a star has no such designation
+        proper_names = (proper + comp_suffix).where(has_proper, '')
+        bf_names = bf_combined.where(bf_combined.str.split().str.len() >= 2, '')
+
+        bayer_clean = bayer.str.replace('-1', '', regex=False).str.replace('-2', '', regex=False)
+        greek = self._lookup_categorical(bayer_clean, self.greek_letters)
+        has_flamsteed = (flamsteed != '') & (flamsteed != '0.0')
+        designation = self._format_catalog_number(flamsteed).where(has_flamsteed, greek.where(bayer != '', ''))
+        constellation_names = (designation + ' ' + constellation + comp_suffix).where(
+            has_constellation & (designation != ''), '')
+
+        # Catalog identifiers
+        var_ids = (var_name + ' ' + constellation).where(has_constellation, var_name).where(var_name != '', '')
+        has_hip = (hip != '') & (hip != '0.0')
+        hip_ids = ('HIP ' + self._format_catalog_number(hip)).where(has_hip, '')
+        gliese_clean = gliese.str.replace('Gl ', '', regex=False).str.strip()
+        gliese_ids = ('Gliese ' + gliese_clean).where(gliese_clean != '', '')
+        hd_ids = ('HD ' + self._format_catalog_number(hd)).where((hd != '') & (hd != '0.0'), '')
+
+        primary_names, all_names, catalog_ids = _build_name_lists(
+            star_ids.to_numpy(), proper_names.to_numpy(), bf_names.to_numpy(),
+            constellation_names.to_numpy(), var_ids.to_numpy(), hip_ids.to_numpy(),
+            gliese_ids.to_numpy(), hd_ids.to_numpy()
+        )
+
+        designation_type = np.select(
+            [has_proper, (constellation_names != '').to_numpy(bool), has_hip.to_numpy(bool),
+             (gliese != '').to_numpy(bool)],
+            ['proper', 'constellation', 'hipparcos', 'gliese'],
+            default='catalog'
+        )
+
+        # Add all naming columns to the dataframe in one block
+        naming = pd.DataFrame({
+            'primary_name': primary_names,
+            'all_names': all_names,
+            'catalog_ids': catalog_ids,
+            'constellation_short': constellation.astype(object),
+            'constellation_full': self._lookup_categorical(constellation, self.constellation_names).astype(object),
+            'has_proper_name': has_proper,
+            'designation_type': designation_type
+        }, index=df.index)
         
-        # Extract and clean values
-        proper = self.clean_value(star_row.get('proper', ''))
-        bayer = self.clean_value(star_row.get('bayer', ''))
-        flamsteed = self.clean_value(star_row.get('flam', ''))
-        constellation = self.clean_value(star_row.get('con', ''))
-        bf_combined = self.clean_value(star_row.get('bf', ''))
-        hip = self.clean_value(star_row.get('hip', ''))
-        gliese = self.clean_value(star_row.get('gl', ''))
-        hd = self.clean_value(star_row.get('hd', ''))
-        var_name = self.clean_value(star_row.get('var', ''))
-        component = self.clean_value(star_row.get('comp', ''))
-        star_id = star_row.get('id', 0)
-        
-        # Build naming hierarchy
-        names = []
-        identifiers = []
+        return pd.concat([df.drop(columns=NAMING_COLUMNS, errors='ignore'), naming], axis=1)
+
+    def process_star_dataframe_polars(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Polars variant of process_star_dataframe.
+
+        Builds the naming columns as a single lazy query so Polars can plan and
+        run the string work across all cores. Falls back to the pandas path
+        when polars is not installed.
+        """
+        if pl is None:
+            return self.process_star_dataframe(df)
         
-        # 1. Proper name (highest priority)
-        if proper:
-            names.append(proper)
-            if component and component not in ['1', '']:
-                names[0] = f'{proper} {component}'
-        
-        # 2. Variable star designation
-        if var_name:
-            var_full = f'{var_name} {constellation}' if constellation else var_name
-            identifiers.append(var_full)
-        
-        # 3. Bayer/Flamsteed combined designation
-        if bf_combined:
-            # Parse combined designation like "9Alp CMa" or "18Eps Eri"
-            bf_parts = bf_combined.split()
-            if len(bf_parts) >= 2:
-                names.append(bf_combined)
-        
-        # 4. Individual constellation designation
-        constellation_name = self.format_constellation_designation(bayer, flamsteed, constellation, component)
-        if constellation_name and constellation_name not in names:
-            names.append(constellation_name)
+        raw = pl.DataFrame({
+            column: (df[column].astype('string').to_numpy(dtype=object, na_value=None).tolist()
+                     if column in df.columns else [None] * len(df))
+            for column in NAMING_FIELDS
+        }, schema={column: pl.Utf8 for column in NAMING_FIELDS})
+        raw = raw.with_columns(pl.Series('id', df['id'].astype(str).tolist() if 'id' in df.columns
+                                         else ['0'] * len(df), dtype=pl.Utf8))
         
-        # 5. Catalog numbers (fallbacks)
-        if hip and hip != '0.0':
-            hip_num = str(int(float(hip))) if '.' in str(hip) else str(hip)
-            identifiers.append(f'HIP {hip_num}')
+        def clean(column):
+            value = pl.col(column).fill_null('').str.strip_chars()
+            return pl.when(value.is_in(['Null', 'nan'])).then(pl.lit('')).otherwise(value).alias(column)
         
-        if gliese:
-            # Clean up Gliese designation
-            gliese_clean = gliese.replace('Gl ', '').strip()
-            if gliese_clean:
-                identifiers.append(f'Gliese {gliese_clean}')
+        def catalog_number(column):
+            # '32349.0' -> '32349'; values without a decimal point are kept as-is
+            number = pl.col(column).cast(pl.Float64, strict=False).cast(pl.Int64, strict=False).cast(pl.Utf8)
+            return (pl.when(pl.col(column).str.contains('.', literal=True) & number.is_not_null())
+                    .then(number).otherwise(pl.col(column)))
         
-        if hd and hd != '0.0':
-            hd_num = str(int(float(hd))) if '.' in str(hd) else str(hd)
-            identifiers.append(f'HD {hd_num}')
+        def present(column):
+            return (pl.col(column) != '') & (pl.col(column) != '0.0')
         
-        # 6. Fallback to star ID
-        if not names and not identifiers:
-            names.append(f'Star {star_id}')
+        def non_empty(*columns):
+            return pl.concat_list(columns).list.eval(pl.element().filter(pl.element() != ''))
         
-        # Choose primary name
-        primary_name = names[0] if names else (identifiers[0] if identifiers else f'Star {star_id}')
+        comp_suffix = (pl.when(pl.col('comp').is_in(['1', ''])).then(pl.lit(''))
+                       .otherwise(pl.lit(' ') + pl.col('comp')))
+        greek = (pl.col('bayer').str.replace_all('-1', '', literal=True)
+                 .str.replace_all('-2', '', literal=True).replace(self.greek_letters))
+        designation = (pl.when(present('flam')).then(catalog_number('flam'))
+                       .when(pl.col('bayer') != '').then(greek)
+                       .otherwise(pl.lit('')))
+        gliese_clean = pl.col('gl').str.replace_all('Gl ', '', literal=True).str.strip_chars()
         
-        # Create full constellation name for description
-        constellation_full = self.constellation_names.get(constellation, constellation) if constellation else ''
+        naming = (
+            raw.lazy()
+            .with_columns([clean(column) for column in NAMING_FIELDS])
+            .with_columns(
+                pl.when(pl.col('proper') != '').then(pl.col('proper') + comp_suffix)
+                .otherwise(pl.lit('')).alias('proper_name'),
+                pl.when(pl.col('bf').str.contains(r'\s')).then(pl.col('bf'))
+                .otherwise(pl.lit('')).alias('bf_name'),
+                pl.when((pl.col('con') != '') & (designation != ''))
+                .then(designation + ' ' + pl.col('con') + comp_suffix)
+                .otherwise(pl.lit('')).alias('constellation_name'),
+                pl.when(pl.col('var') == '').then(pl.lit(''))
+                .when(pl.col('con') != '').then(pl.col('var') + ' ' + pl.col('con'))
+                .otherwise(pl.col('var')).alias('var_id'),
+                pl.when(present('hip')).then(pl.lit('HIP ') + catalog_number('hip'))
+                .otherwise(pl.lit('')).alias('hip_id'),
+                pl.when(gliese_clean != '').then(pl.lit('Gliese ') + gliese_clean)
+                .otherwise(pl.lit('')).alias('gliese_id'),
+                pl.when(present('hd')).then(pl.lit('HD ') + catalog_number('hd'))
+                .otherwise(pl.lit('')).alias('hd_id'),
+            )
+            .with_columns(
+                non_empty(
+                    'proper_name', 'bf_name',
+                    pl.when((pl.col('constellation_name') == pl.col('proper_name')) |
+                            (pl.col('constellation_name') == pl.col('bf_name')))
+                    .then(pl.lit('')).otherwise(pl.col('constellation_name'))
+                ).alias('names'),
+                non_empty('var_id', 'hip_id', 'gliese_id', 'hd_id').alias('catalog_ids'),
+            )
+            .with_columns(
+                pl.when((pl.col('names').list.len() == 0) & (pl.col('catalog_ids').list.len() == 0))
+                .then(pl.concat_list(pl.lit('Star ') + pl.col('id')))
+                .otherwise(pl.col('names')).alias('all_names'),
+            )
+            .select(
+                pl.coalesce(pl.col('all_names').list.first(), pl.col('catalog_ids').list.first())
+                .alias('primary_name'),
+                'all_names',
+                'catalog_ids',
+                pl.col('con').alias('constellation_short'),
+                pl.col('con').replace(self.constellation_names).alias('constellation_full'),
+                (pl.col('proper') != '').alias('has_proper_name'),
+                pl.when(pl.col('proper') != '').then(pl.lit('proper'))
+                .when(pl.col('constellation_name') != '').then(pl.lit('constellation'))
+                .when(present('hip')).then(pl.lit('hipparcos'))
+                .when(pl.col('gl') != '').then(pl.lit('gliese'))
+                .otherwise(pl.lit('catalog')).alias('designation_type'),
+            )
+            .collect()
+        )
         
-        return {
-            'primary_name': primary_name,
-            'all_names': names,
-            'catalog_ids': identifiers,
-            'constellation_short': constellation,
-            'constellation_full': constellation_full,
-            'has_proper_name': bool(proper),
-            'designation_type': self._get_designation_type(primary_name, proper, constellation_name, hip, gliese)
-        }
-    
-    def _get_designation_type(self, primary_name: str, proper: str, constellation_name: str, 
-                            hip: str, gliese: str) -> str:
-        """Determine the type of the primary designation"""
-        if proper:
-            return 'proper'
-        elif constellation_name:
-            return 'constellation'
-        elif hip and hip != '0.0':
-            return 'hipparcos'
-        elif gliese:
-            return 'gliese'
-        else:
-            return 'catalog'
+        naming = pd.DataFrame({column: naming[column].to_list() for column in NAMING_COLUMNS}, index=df.index)
+        return pd.concat([df.drop(columns=NAMING_COLUMNS, errors='ignore'), naming], axis=1)
 
-    def process_star_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Process entire dataframe to add naming information"""
-        naming_data = []
-        
-        for _, star_row in df.iterrows():
-            star_naming = self.generate_star_name(star_row)
-            naming_data.append(star_naming)
-        
-        # Add naming columns to dataframe
-        for key in ['primary_name', 'all_names', 'catalog_ids', 'constellation_short', 
-                   'constellation_full', 'has_proper_name', 'designation_type']:
-            df[key] = [item[key] for item in naming_data]
-        
-        return df
+    def build_search_blob(self, df: pd.DataFrame) -> pd.Series:
+        """Join each star's precomputed names and identifiers into one lower-cased string.
+
+        Requires the columns added by process_star_dataframe. Entries are
+        newline-separated so a search term cannot match across two names.
+        """
+        return pd.Series([
+            '\n'.join((primary, *names, *identifiers)).lower()
+            for primary, names, identifiers in zip(df['primary_name'], df['all_names'], df['catalog_ids'])
+        ], index=df.index, dtype=object)
 
-    def search_stars_by_name(self, df: pd.DataFrame, search_term: str) -> pd.DataFrame:
-        """Search stars by any of their names or identifiers"""
+    def search_stars_by_name(self, df: pd.DataFrame, search_term: str,
+                             search_blob: Optional[pd.Series] = None) -> pd.DataFrame:
+        """Search stars by any of their names or identifiers
+        
+        search_blob is an optional build_search_blob result for df, kept by
+        callers that search the same frame repeatedly.
+        """
         search_term = search_term.lower().strip()
         
+        # Prefer names already derived by process_star_dataframe
+        if search_blob is not None:
+            return df[search_blob.str.contains(search_term, regex=False)]
+        if all(column in df.columns for column in NAMING_COLUMNS):
+            return df[self.build_search_blob(df).str.contains(search_term, regex=False)]
+        
         def matches_search(star_row):
-            star_naming = self.generate_star_name(star_row)
+            naming = self._naming_for_row(star_row)
             
             # Check primary name
-            if search_term in star_naming['primary_name'].lower():
+            if search_term in naming.primary_name.lower():
                 return True
             
             # Check all names
-            for name in star_naming['all_names']:
+            for name in naming.all_names:
                 if search_term in name.lower():
                     return True
             
             # Check catalog IDs
-            for cat_id in star_naming['catalog_ids']:
+            for cat_id in naming.catalog_ids:
                 if search_term in cat_id.lower():
                     return True
             
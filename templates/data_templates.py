@@ -3,69 +3,208 @@ Data entry templates for Starmap database
 These templates provide standardized formats for adding new data
 """
 
+import functools
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from functools import cached_property
+from math import sqrt
+from types import MappingProxyType
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _jit(func):
+    """Compile scalar physics helpers with numba when it is installed"""
+    return njit(cache=True)(func) if njit is not None else func
+
+
+# Default strings shared by every template record that doesn't override them
+_UNKNOWN = sys.intern("Unknown")
+_NONE = sys.intern("None")
+_STANDARD = sys.intern("Standard")
+_WEEKLY = sys.intern("Weekly")
+_FREE_TRADE_ZONE = sys.intern("Free Trade Zone")
+_DEFAULT_DISCOVERY_YEAR = sys.intern("2300")
+
+
+def _record(cls):
+    """Give a slotted, frozen template dataclass a generated ``as_dict()``
+    
+    The method body is a single dict literal over the class's fields, so
+    conversion does no per-field reflection. The record also gets
+    ``__getstate__``/``__setstate__``: the default slot restore goes through
+    the frozen ``__setattr__``, which would break copy, deepcopy and pickle.
+    """
+    cls._FIELDS = tuple(f.name for f in fields(cls))
+    source = "def as_dict(self):\n    return {%s}\n" % ', '.join(
+        f"{name!r}: self.{name}" for name in cls._FIELDS
+    )
+    namespace = {}
+    exec(source, namespace)
+    as_dict = namespace['as_dict']
+    as_dict.__qualname__ = f"{cls.__name__}.as_dict"
+    as_dict.__doc__ = f"Return the {cls.__name__.lower()} as a plain dict in field order"
+    cls.as_dict = as_dict
+    cls.__getstate__ = _record_getstate
+    cls.__setstate__ = _record_setstate
+    return cls
+
+
+def _record_getstate(self):
+    """Field values in ``_FIELDS`` order, for copy and pickle"""
+    return tuple(getattr(self, name) for name in self._FIELDS)
+
+
+def _record_setstate(self, state):
+    """Restore field values past the frozen ``__setattr__``"""
+    for name, value in zip(self._FIELDS, state):
+        object.__setattr__(self, name, value)
+
+
+@_record
+@dataclass(frozen=True)
+class Star:
+    """Star record produced by StarTemplate.create_basic_star"""
+    
+    __slots__ = (
+        'id', 'hip', 'hd', 'hr', 'gl', 'bf', 'proper', 'ra', 'dec', 'dist',
+        'pmra', 'pmdec', 'rv', 'mag', 'absmag', 'spect', 'ci', 'x', 'y', 'z',
+        'vx', 'vy', 'vz', 'rarad', 'decrad', 'pmrarad', 'pmdecrad',
+        'bayer', 'flam', 'con', 'comp', 'comp_primary', 'base', 'lum',
+        'var', 'var_min', 'var_max', 'UUID'
+    )
+    
+    id: int
+    hip: Optional[int]
+    hd: Optional[int]
+    hr: Optional[int]
+    gl: Optional[str]
+    bf: Optional[str]
+    proper: str
+    ra: float
+    dec: float
+    dist: float
+    pmra: float
+    pmdec: float
+    rv: float
+    mag: float
+    absmag: float
+    spect: str
+    ci: float
+    x: float
+    y: float
+    z: float
+    vx: float
+    vy: float
+    vz: float
+    rarad: float
+    decrad: float
+    pmrarad: float
+    pmdecrad: float
+    bayer: str
+    flam: str
+    con: str
+    comp: int
+    comp_primary: int
+    base: int
+    lum: float
+    var: str
+    var_min: Optional[float]
+    var_max: Optional[float]
+    UUID: str
+
+
+# Source expression for every Star field in terms of create_basic_star's arguments
+_BASIC_STAR_VALUES = {
+    'id': 'star_id',
+    'hip': 'None',
+    'hd': 'None',
+    'hr': 'None',
+    'gl': 'None',
+    'bf': 'None',
+    'proper': 'name',
+    'ra': '0.0',  # Will be calculated from coordinates
+    'dec': '0.0',  # Will be calculated from coordinates
+    'dist': 'distance_parsecs',
+    'pmra': '0.0',
+    'pmdec': '0.0',
+    'rv': '0.0',
+    'mag': 'magnitude',
+    'absmag': 'magnitude',  # Will be calculated
+    'spect': 'spectral_class',
+    'ci': '0.0',
+    'x': 'x',
+    'y': 'y',
+    'z': 'z',
+    'vx': '0.0',
+    'vy': '0.0',
+    'vz': '0.0',
+    'rarad': '0.0',
+    'decrad': '0.0',
+    'pmrarad': '0.0',
+    'pmdecrad': '0.0',
+    'bayer': "''",
+    'flam': "''",
+    'con': "''",
+    'comp': '1',
+    'comp_primary': 'star_id',
+    'base': 'star_id',
+    'lum': '1.0',  # Will be calculated from spectral class
+    'var': "''",
+    'var_min': 'None',
+    'var_max': 'None',
+    'UUID': 'f"custom-star-{star_id}"'
+}
+
+
+def _basic_star_factory(func_name: str, as_record: bool):
+    """Compile a basic-star factory with every default inlined
+    
+    With as_record the factory returns a Star, otherwise the database dict
+    directly, so callers that only need the dict skip the intermediate record.
+    """
+    if as_record:
+        body = "Star(%s)" % ', '.join(_BASIC_STAR_VALUES[name] for name in Star._FIELDS)
+        kind = "Star record (use ``as_dict()`` for the database format)"
+    else:
+        body = "{%s}" % ', '.join(
+            f"{name!r}: {_BASIC_STAR_VALUES[name]}" for name in Star._FIELDS
+        )
+        kind = "star dict in database format"
+    source = (
+        f"def {func_name}(star_id, name, x, y, z, magnitude, spectral_class, distance_parsecs=None):\n"
+        f"    if distance_parsecs is None:\n"
+        f"        distance_parsecs = sqrt(x * x + y * y + z * z)\n"
+        f"    return {body}\n"
+    )
+    namespace = {'Star': Star, 'sqrt': sqrt}
+    exec(source, namespace)
+    factory = namespace[func_name]
+    factory.__qualname__ = f"StarTemplate.{func_name}"
+    factory.__doc__ = f"Create a basic star entry as a {kind}"
+    factory.__annotations__ = {
+        'star_id': int, 'name': str, 'x': float, 'y': float, 'z': float,
+        'magnitude': float, 'spectral_class': str,
+        'distance_parsecs': Optional[float],
+        'return': Star if as_record else Dict
+    }
+    return factory
 
 
 class StarTemplate:
     """Template for adding new stars to the database"""
     
-    @staticmethod
-    def create_basic_star(
-        star_id: int,
-        name: str,
-        x: float,
-        y: float,
-        z: float,
-        magnitude: float,
-        spectral_class: str,
-        distance_parsecs: Optional[float] = None
-    ) -> Dict:
-        """Create a basic star entry"""
-        
-        if distance_parsecs is None:
-            distance_parsecs = (x**2 + y**2 + z**2)**0.5
-        
-        return {
-            'id': star_id,
-            'hip': None,
-            'hd': None,
-            'hr': None,
-            'gl': None,
-            'bf': None,
-            'proper': name,
-            'ra': 0.0,  # Will be calculated from coordinates
-            'dec': 0.0,  # Will be calculated from coordinates
-            'dist': distance_parsecs,
-            'pmra': 0.0,
-            'pmdec': 0.0,
-            'rv': 0.0,
-            'mag': magnitude,
-            'absmag': magnitude,  # Will be calculated
-            'spect': spectral_class,
-            'ci': 0.0,
-            'x': x,
-            'y': y,
-            'z': z,
-            'vx': 0.0,
-            'vy': 0.0,
-            'vz': 0.0,
-            'rarad': 0.0,
-            'decrad': 0.0,
-            'pmrarad': 0.0,
-            'pmdecrad': 0.0,
-            'bayer': '',
-            'flam': '',
-            'con': '',
-            'comp': 1,
-            'comp_primary': star_id,
-            'base': star_id,
-            'lum': 1.0,  # Will be calculated from spectral class
-            'var': '',
-            'var_min': None,
-            'var_max': None,
-            'UUID': f"custom-star-{star_id}"
-        }
+    create_basic_star = staticmethod(_basic_star_factory('create_basic_star', as_record=True))
+    create_basic_star_dict = staticmethod(_basic_star_factory('create_basic_star_dict', as_record=False))
     
     @staticmethod
     def create_fictional_star(
@@ -82,7 +221,7 @@ class StarTemplate:
     ) -> Dict:
         """Create a fictional star with narrative elements"""
         
-        base_star = StarTemplate.create_basic_star(
+        base_star = StarTemplate.create_basic_star_dict(
             star_id, system_name, x, y, z, magnitude, spectral_class
         )
         
@@ -95,6 +234,137 @@ class StarTemplate:
         })
         
         return base_star
+    
+    @staticmethod
+    def create_basic_stars_bulk(
+        star_ids: Sequence[int],
+        names: Sequence[str],
+        xyz: np.ndarray,
+        magnitudes: Sequence[float],
+        spectral_classes: Sequence[str],
+        distances_parsecs: Optional[Sequence[float]] = None
+    ) -> pd.DataFrame:
+        """Create many basic star entries at once
+        
+        xyz is an (N, 3) array of coordinates. Returns one row per star with
+        the same columns as create_basic_star; use ``to_dict('records')`` to
+        feed DataManager.bulk_add_stars.
+        """
+        
+        xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+        count = len(xyz)
+        ids = np.asarray(star_ids, dtype=np.int64)
+        mags = np.asarray(magnitudes, dtype=np.float64)
+        
+        if distances_parsecs is None:
+            dist = np.sqrt(np.einsum('ij,ij->i', xyz, xyz))
+        else:
+            dist = np.asarray(distances_parsecs, dtype=np.float64)
+        
+        zeros = np.zeros(count)
+        blanks = np.full(count, '', dtype=object)
+        nones = np.full(count, None, dtype=object)
+        
+        columns = {
+            'id': ids,
+            'hip': nones,
+            'hd': nones,
+            'hr': nones,
+            'gl': nones,
+            'bf': nones,
+            'proper': np.asarray(names, dtype=object),
+            'ra': zeros,
+            'dec': zeros,
+            'dist': dist,
+            'pmra': zeros,
+            'pmdec': zeros,
+            'rv': zeros,
+            'mag': mags,
+            'absmag': mags,
+            'spect': np.asarray(spectral_classes, dtype=object),
+            'ci': zeros,
+            'x': xyz[:, 0],
+            'y': xyz[:, 1],
+            'z': xyz[:, 2],
+            'vx': zeros,
+            'vy': zeros,
+            'vz': zeros,
+            'rarad': zeros,
+            'decrad': zeros,
+            'pmrarad': zeros,
+            'pmdecrad': zeros,
+            'bayer': blanks,
+            'flam': blanks,
+            'con': blanks,
+            'comp': np.ones(count, dtype=np.int64),
+            'comp_primary': ids,
+            'base': ids,
+            'lum': np.ones(count),
+            'var': blanks,
+            'var_min': nones,
+            'var_max': nones,
+            'UUID': np.char.add('custom-star-', ids.astype(str)).astype(object)
+        }
+        return pd.DataFrame(columns, columns=list(Star._FIELDS))
+
+
+# Fields every nation starts with before any customisation
+_NATION_DEFAULTS = MappingProxyType({
+    'population': _UNKNOWN,
+    'military_strength': sys.intern("Standard Defense Forces"),
+    'economic_focus': sys.intern("Balanced Economy"),
+    'political_alignment': sys.intern("Independent"),
+    'diplomatic_stance': sys.intern("Neutral")
+})
+
+_TRADER_DEFAULTS = MappingProxyType({
+    'government_type': "Trade Confederation",
+    'capital_planet': "Trade Hub Alpha",
+    'color': "#4CAF50",
+    'border_color': "#388E3C"
+})
+
+_EXPLORER_DEFAULTS = MappingProxyType({
+    'government_type': "Exploration Coalition",
+    'capital_planet': "Explorer Base",
+    'color': "#2196F3",
+    'border_color': "#1976D2",
+    'description': "A coalition of explorers and scientists pushing the boundaries of known space"
+})
+
+_EXPLORER_SPECIALTIES = ("Exploration", "Scientific Research", "Frontier Development")
+
+
+@_record
+@dataclass(frozen=True)
+class Nation:
+    """Nation record produced by NationTemplate"""
+    
+    __slots__ = (
+        'name', 'full_name', 'capital_system', 'capital_star_id', 'capital_planet',
+        'government_type', 'color', 'border_color', 'established_year',
+        'description', 'territories', 'specialties', 'population',
+        'military_strength', 'economic_focus', 'political_alignment',
+        'diplomatic_stance'
+    )
+    
+    name: str
+    full_name: str
+    capital_system: str
+    capital_star_id: int
+    capital_planet: str
+    government_type: str
+    color: str
+    border_color: str
+    established_year: int
+    description: str
+    territories: List[int]
+    specialties: List[str]
+    population: str
+    military_strength: str
+    economic_focus: str
+    political_alignment: str
+    diplomatic_stance: str
 
 
 class NationTemplate:
@@ -115,7 +385,7 @@ class NationTemplate:
         description: str = "",
         territories: Optional[List[int]] = None,
         specialties: Optional[List[str]] = None
-    ) -> Dict:
+    ) -> Nation:
         """Create a new nation entry"""
         
         if territories is None:
@@ -124,25 +394,21 @@ class NationTemplate:
         if specialties is None:
             specialties = ["Trade", "Exploration"]
         
-        return {
-            'name': name,
-            'full_name': full_name,
-            'capital_system': capital_system,
-            'capital_star_id': capital_star_id,
-            'capital_planet': capital_planet,
-            'government_type': government_type,
-            'color': color,
-            'border_color': border_color,
-            'established_year': established_year,
-            'description': description,
-            'territories': territories,
-            'specialties': specialties,
-            'population': "Unknown",
-            'military_strength': "Standard Defense Forces",
-            'economic_focus': "Balanced Economy",
-            'political_alignment': "Independent",
-            'diplomatic_stance': "Neutral"
-        }
+        return Nation(
+            name=name,
+            full_name=full_name,
+            capital_system=capital_system,
+            capital_star_id=capital_star_id,
+            capital_planet=capital_planet,
+            government_type=government_type,
+            color=color,
+            border_color=border_color,
+            established_year=established_year,
+            description=description,
+            territories=territories,
+            specialties=specialties,
+            **_NATION_DEFAULTS
+        )
     
     @staticmethod
     def create_trading_confederation(
@@ -153,23 +419,20 @@ class NationTemplate:
         established_year: int,
         member_systems: List[int],
         trade_specialties: List[str]
-    ) -> Dict:
+    ) -> Nation:
         """Create a trade-focused confederation"""
         
         return NationTemplate.create_nation(
             nation_id=nation_id,
             name=name,
             full_name=f"The {name} Trading Confederation",
-            government_type="Trade Confederation",
             capital_system=capital_system,
             capital_star_id=capital_star_id,
-            capital_planet="Trade Hub Alpha",
             established_year=established_year,
-            color="#4CAF50",
-            border_color="#388E3C",
             description=f"A peaceful trading confederation specializing in {', '.join(trade_specialties)}",
             territories=member_systems,
-            specialties=trade_specialties
+            specialties=trade_specialties,
+            **_TRADER_DEFAULTS
         )
     
     @staticmethod
@@ -180,26 +443,54 @@ class NationTemplate:
         capital_star_id: int,
         established_year: int,
         frontier_systems: List[int]
-    ) -> Dict:
+    ) -> Nation:
         """Create an exploration-focused coalition"""
         
         return NationTemplate.create_nation(
             nation_id=nation_id,
             name=name,
             full_name=f"The {name} Exploration Coalition",
-            government_type="Exploration Coalition",
             capital_system=capital_system,
             capital_star_id=capital_star_id,
-            capital_planet="Explorer Base",
             established_year=established_year,
-            color="#2196F3",
-            border_color="#1976D2",
-            description="A coalition of explorers and scientists pushing the boundaries of known space",
             territories=frontier_systems,
-            specialties=["Exploration", "Scientific Research", "Frontier Development"]
+            specialties=list(_EXPLORER_SPECIALTIES),
+            **_EXPLORER_DEFAULTS
         )
 
 
+_PASSENGER_CARGO = ("Passengers", "Personal Effects", "Mail")
+
+
+@_record
+@dataclass(frozen=True)
+class TradeRoute:
+    """Trade route record produced by TradeRouteTemplate"""
+    
+    __slots__ = (
+        'name', 'from_star_id', 'to_star_id', 'from_system', 'to_system',
+        'route_type', 'established', 'cargo_types', 'travel_time_days',
+        'frequency', 'controlling_nation', 'security_level', 'description',
+        'regions', 'economic_zone'
+    )
+    
+    name: str
+    from_star_id: int
+    to_star_id: int
+    from_system: str
+    to_system: str
+    route_type: str
+    established: int
+    cargo_types: Sequence[str]
+    travel_time_days: int
+    frequency: str
+    controlling_nation: str
+    security_level: str
+    description: str
+    regions: List[str]
+    economic_zone: str
+
+
 class TradeRouteTemplate:
     """Template for adding new trade routes"""
     
@@ -212,32 +503,21 @@ class TradeRouteTemplate:
         to_system: str,
         route_type: str,
         controlling_nation: str,
-        cargo_types: List[str],
+        cargo_types: Sequence[str],
         travel_time_days: int,
-        frequency: str = "Weekly",
-        security_level: str = "Standard",
+        frequency: str = _WEEKLY,
+        security_level: str = _STANDARD,
         established_year: int = 2300,
         description: str = ""
-    ) -> Dict:
+    ) -> TradeRoute:
         """Create a new trade route entry"""
         
-        return {
-            'name': route_name,
-            'from_star_id': from_star_id,
-            'to_star_id': to_star_id,
-            'from_system': from_system,
-            'to_system': to_system,
-            'route_type': route_type,
-            'established': established_year,
-            'cargo_types': cargo_types,
-            'travel_time_days': travel_time_days,
-            'frequency': frequency,
-            'controlling_nation': controlling_nation,
-            'security_level': security_level,
-            'description': description,
-            'regions': [],
-            'economic_zone': "Free Trade Zone"
-        }
+        return TradeRoute(
+            route_name, from_star_id, to_star_id, from_system, to_system,
+            route_type, established_year, cargo_types, travel_time_days,
+            frequency, controlling_nation, security_level, description,
+            [], _FREE_TRADE_ZONE
+        )
     
     @staticmethod
     def create_mining_route(
@@ -248,7 +528,7 @@ class TradeRouteTemplate:
         processing_star_id: int,
         controlling_nation: str,
         ore_types: List[str]
-    ) -> Dict:
+    ) -> TradeRoute:
         """Create a mining-focused trade route"""
         
         return TradeRouteTemplate.create_trade_route(
@@ -259,7 +539,7 @@ class TradeRouteTemplate:
             to_system=processing_system,
             route_type="Mining",
             controlling_nation=controlling_nation,
-            cargo_types=ore_types + ["Mining Equipment", "Processed Materials"],
+            cargo_types=(*ore_types, "Mining Equipment", "Processed Materials"),
             travel_time_days=14,
             frequency="Bi-weekly",
             security_level="High",
@@ -274,8 +554,8 @@ class TradeRouteTemplate:
         destination_system: str,
         destination_star_id: int,
         controlling_nation: str,
-        service_class: str = "Standard"
-    ) -> Dict:
+        service_class: str = _STANDARD
+    ) -> TradeRoute:
         """Create a passenger transport route"""
         
         return TradeRouteTemplate.create_trade_route(
@@ -286,7 +566,7 @@ class TradeRouteTemplate:
             to_system=destination_system,
             route_type="Passenger",
             controlling_nation=controlling_nation,
-            cargo_types=["Passengers", "Personal Effects", "Mail"],
+            cargo_types=_PASSENGER_CARGO,
             travel_time_days=7,
             frequency="Daily",
             security_level="Maximum",
@@ -294,6 +574,116 @@ class TradeRouteTemplate:
         )
 
 
+@_jit
+def _orbit_physics(distance_au):
+    """Return (orbital period in days, equilibrium temperature in K) at distance_au"""
+    # Kepler's third law and a solar-flux temperature estimate (both simplified)
+    return distance_au * sqrt(distance_au) * 365.25, 278.0 / sqrt(distance_au)
+
+
+@_jit
+def _surface_physics(mass_earth, radius_earth):
+    """Return (surface gravity in g, escape velocity in km/s), both approximate"""
+    return mass_earth / (radius_earth * radius_earth), 22.4 * sqrt(mass_earth / radius_earth)
+
+
+@functools.lru_cache(maxsize=2048)
+def _derived(mass_earth: float, radius_earth: float) -> Tuple[float, float]:
+    """Surface physics memoized per (mass, radius); templates reuse a few size classes"""
+    return _surface_physics(mass_earth, radius_earth)
+
+
+# Planet classification codes used for system statistics
+_GAS_GIANT = 0
+_TERRESTRIAL = 1
+_OTHER_PLANET = -1
+
+_TYPE_CODES = MappingProxyType({
+    'Gas Giant': _GAS_GIANT,
+    'Terrestrial': _TERRESTRIAL,
+    'Hot Terrestrial': _TERRESTRIAL,
+    'Habitable Terrestrial': _TERRESTRIAL,
+})
+
+
+def _planet_type_code(planet_type: str) -> int:
+    """Classification code for a planet type; unlisted types are classified by name"""
+    code = _TYPE_CODES.get(planet_type)
+    if code is None:
+        return _TERRESTRIAL if 'Terrestrial' in planet_type else _OTHER_PLANET
+    return code
+
+
+@_record
+@dataclass(frozen=True)
+class Planet:
+    """Planet record produced by PlanetarySystemTemplate.create_planet"""
+    
+    __slots__ = (
+        'name', 'type', 'distance_au', 'mass_earth', 'radius_earth',
+        'orbital_period_days', 'temperature_k', 'atmosphere', 'has_life',
+        'inhabited', 'population', 'discovery_year', 'confirmed',
+        'surface_gravity', 'escape_velocity', 'day_length_hours',
+        'axial_tilt_degrees', 'moons'
+    )
+    
+    name: str
+    type: str
+    distance_au: float
+    mass_earth: float
+    radius_earth: float
+    orbital_period_days: float
+    temperature_k: float
+    atmosphere: str
+    has_life: bool
+    inhabited: bool
+    population: int
+    discovery_year: str
+    confirmed: bool
+    surface_gravity: float
+    escape_velocity: float  # km/s
+    day_length_hours: float
+    axial_tilt_degrees: float
+    moons: List[Dict]
+
+
+@_record
+@dataclass(frozen=True)
+class HabitableWorld(Planet):
+    """Planet with civilization details, from create_habitable_world"""
+    
+    __slots__ = ('civilization_level', 'habitability_score')
+    
+    civilization_level: str
+    habitability_score: float
+
+
+@_record
+@dataclass(frozen=True)
+class GasGiant(Planet):
+    """Planet with moon and ring details, from create_gas_giant"""
+    
+    __slots__ = ('moon_count', 'ring_system')
+    
+    moon_count: int
+    ring_system: bool
+
+
+def _build_planet(cls, name, planet_type, distance_au, mass_earth, radius_earth,
+                  orbital_period_days, temperature_k, atmosphere, has_life,
+                  inhabited, population, discovery_year, confirmed, *extra):
+    """Construct cls with derived surface physics and Earth-like defaults"""
+    surface_gravity, escape_velocity = _derived(mass_earth, radius_earth)
+    return cls(
+        name, planet_type, distance_au, mass_earth, radius_earth,
+        orbital_period_days, temperature_k, atmosphere, has_life, inhabited,
+        population, discovery_year, confirmed, surface_gravity, escape_velocity,
+        24.0,  # day length, default Earth-like
+        23.5,  # axial tilt, default Earth-like
+        [], *extra
+    )
+
+
 class PlanetarySystemTemplate:
     """Template for adding planetary systems"""
     
@@ -306,35 +696,20 @@ class PlanetarySystemTemplate:
         radius_earth: float,
         orbital_period_days: float,
         temperature_k: float,
-        atmosphere: str = "None",
+        atmosphere: str = _NONE,
         has_life: bool = False,
         inhabited: bool = False,
         population: int = 0,
-        discovery_year: str = "2300",
+        discovery_year: str = _DEFAULT_DISCOVERY_YEAR,
         confirmed: bool = True
-    ) -> Dict:
+    ) -> Planet:
         """Create a planet entry"""
         
-        return {
-            'name': name,
-            'type': planet_type,
-            'distance_au': distance_au,
-            'mass_earth': mass_earth,
-            'radius_earth': radius_earth,
-            'orbital_period_days': orbital_period_days,
-            'temperature_k': temperature_k,
-            'atmosphere': atmosphere,
-            'has_life': has_life,
-            'inhabited': inhabited,
-            'population': population,
-            'discovery_year': discovery_year,
-            'confirmed': confirmed,
-            'surface_gravity': mass_earth / (radius_earth ** 2),  # Approximate
-            'escape_velocity': (2 * 11.2 * (mass_earth / radius_earth) ** 0.5),  # km/s, approximate
-            'day_length_hours': 24.0,  # Default Earth-like
-            'axial_tilt_degrees': 23.5,  # Default Earth-like
-            'moons': []
-        }
+        return _build_planet(
+            Planet, name, planet_type, distance_au, mass_earth, radius_earth,
+            orbital_period_days, temperature_k, atmosphere, has_life, inhabited,
+            population, discovery_year, confirmed
+        )
     
     @staticmethod
     def create_habitable_world(
@@ -345,34 +720,19 @@ class PlanetarySystemTemplate:
         atmosphere: str = "N2 (78%), O2 (21%), CO2 (400ppm)",
         inhabited: bool = False,
         population: int = 0,
-        civilization_level: str = "None"
-    ) -> Dict:
+        civilization_level: str = _NONE
+    ) -> HabitableWorld:
         """Create a habitable world"""
         
-        # Calculate orbital period using Kepler's third law (simplified)
-        orbital_period = (distance_au ** 1.5) * 365.25
+        orbital_period, temperature = _orbit_physics(distance_au)
         
-        # Calculate temperature based on distance (very simplified)
-        temperature = 278 * (1.0 / distance_au) ** 0.5  # Approximate
-        
-        planet = PlanetarySystemTemplate.create_planet(
-            name=name,
-            planet_type="Habitable Terrestrial",
-            distance_au=distance_au,
-            mass_earth=mass_earth,
-            radius_earth=radius_earth,
-            orbital_period_days=orbital_period,
-            temperature_k=temperature,
-            atmosphere=atmosphere,
-            has_life=True,
-            inhabited=inhabited,
-            population=population
+        return _build_planet(
+            HabitableWorld, name, "Habitable Terrestrial", distance_au,
+            mass_earth, radius_earth, orbital_period, temperature, atmosphere,
+            True, inhabited, population, _DEFAULT_DISCOVERY_YEAR, True,
+            civilization_level,
+            0.8  # High habitability
         )
-        
-        planet['civilization_level'] = civilization_level
-        planet['habitability_score'] = 0.8  # High habitability
-        
-        return planet
     
     @staticmethod
     def create_gas_giant(
@@ -382,56 +742,74 @@ class PlanetarySystemTemplate:
         radius_earth: float,
         atmosphere: str = "H2, He (Jupiter-like)",
         moon_count: int = 0
-    ) -> Dict:
+    ) -> GasGiant:
         """Create a gas giant"""
         
-        orbital_period = (distance_au ** 1.5) * 365.25
-        temperature = 278 * (1.0 / distance_au) ** 0.5
+        orbital_period, temperature = _orbit_physics(distance_au)
         
-        planet = PlanetarySystemTemplate.create_planet(
-            name=name,
-            planet_type="Gas Giant",
-            distance_au=distance_au,
-            mass_earth=mass_earth,
-            radius_earth=radius_earth,
-            orbital_period_days=orbital_period,
-            temperature_k=temperature,
-            atmosphere=atmosphere
+        return _build_planet(
+            GasGiant, name, "Gas Giant", distance_au, mass_earth, radius_earth,
+            orbital_period, temperature, atmosphere, False, False, 0, _DEFAULT_DISCOVERY_YEAR, True,
+            moon_count,
+            moon_count > 10  # Assume ring system for large moon counts
         )
-        
-        planet['moon_count'] = moon_count
-        planet['ring_system'] = moon_count > 10  # Assume ring system for large moon counts
-        
-        return planet
     
     @staticmethod
     def create_planetary_system(
         star_id: int,
         system_name: str,
-        planets: List[Dict],
+        planets: List[Union[Planet, Dict]],
         system_age_billion_years: float = 4.5,
         metallicity: float = 0.0,
         description: str = ""
     ) -> Dict:
         """Create a complete planetary system"""
         
-        # Calculate system statistics
+        # Calculate system statistics in a single pass, reading template
+        # records by attribute and converting them for storage as we go
         total_planets = len(planets)
-        habitable_worlds = [p for p in planets if p.get('has_life', False)]
-        gas_giants = [p for p in planets if p.get('type') == 'Gas Giant']
-        terrestrial_planets = [p for p in planets if 'Terrestrial' in p.get('type', '')]
+        planet_dicts = []
+        habitable_worlds = []
+        gas_giants = 0
+        terrestrial_planets = 0
+        colonized = False
+        total_population = 0
+        
+        for planet in planets:
+            if isinstance(planet, Planet):
+                planet_dict = planet.as_dict()
+                planet_has_life = planet.has_life
+                planet_type = planet.type
+                inhabited = planet.inhabited
+                population = planet.population
+            else:
+                planet_dict = planet
+                planet_has_life = planet.get('has_life', False)
+                planet_type = planet.get('type', '')
+                inhabited = planet.get('inhabited', False)
+                population = planet.get('population', 0)
+            
+            planet_dicts.append(planet_dict)
+            if planet_has_life:
+                habitable_worlds.append(planet_dict)
+            type_code = _planet_type_code(planet_type)
+            if type_code == _GAS_GIANT:
+                gas_giants += 1
+            elif type_code == _TERRESTRIAL:
+                terrestrial_planets += 1
+            if inhabited:
+                colonized = True
+            total_population += population
         
         has_life = len(habitable_worlds) > 0
-        colonized = any(p.get('inhabited', False) for p in planets)
-        total_population = sum(p.get('population', 0) for p in planets)
         
         return {
             'star_id': star_id,
             'system_name': system_name,
-            'planets': planets,
+            'planets': planet_dicts,
             'total_planets': total_planets,
-            'terrestrial_planets': len(terrestrial_planets),
-            'gas_giants': len(gas_giants),
+            'terrestrial_planets': terrestrial_planets,
+            'gas_giants': gas_giants,
             'habitable_worlds': habitable_worlds,
             'has_life': has_life,
             'colonized': colonized,
@@ -490,96 +868,177 @@ class StellarRegionTemplate:
             'brightest_star_id': brightest_star_id,
             'brightest_star_magnitude': 0.0  # Will be calculated
         }
+    
+    @staticmethod
+    def create_stellar_regions_bulk(
+        region_names: Sequence[str],
+        short_names: Sequence[str],
+        bounds: np.ndarray,
+        colors: Optional[Sequence[List[int]]] = None,
+        descriptions: Optional[Sequence[str]] = None,
+        classification: str = "Galactic Region"
+    ) -> List[Dict]:
+        """Create many stellar region definitions at once
+        
+        bounds is an (N, 6) array of (x_min, x_max, y_min, y_max, z_min, z_max)
+        rows. Centers and diameters are computed for all regions in one pass;
+        the result matches calling create_stellar_region per region.
+        """
+        
+        bounds = np.asarray(bounds, dtype=np.float64).reshape(-1, 6)
+        mins = bounds[:, ::2]
+        maxs = bounds[:, 1::2]
+        centers = ((mins + maxs) / 2).tolist()
+        diameters = (maxs - mins).max(axis=1).tolist()
+        ranges = bounds.reshape(-1, 3, 2).tolist()
+        
+        count = len(bounds)
+        if colors is None:
+            colors = [None] * count
+        if descriptions is None:
+            descriptions = [""] * count
+        
+        return [
+            {
+                'name': name,
+                'short_name': short_name,
+                'description': description,
+                'x_range': x_range,
+                'y_range': y_range,
+                'z_range': z_range,
+                'center_point': center,
+                'color': color if color is not None else [100, 150, 200],
+                'diameter': diameter,
+                'classification': classification,
+                'established': "Galactic Survey Era",
+                'brightest_star': "",
+                'brightest_star_id': None,
+                'brightest_star_magnitude': 0.0
+            }
+            for name, short_name, (x_range, y_range, z_range), center, diameter, color, description
+            in zip(region_names, short_names, ranges, centers, diameters, colors, descriptions)
+        ]
 
 
 # Example usage templates
-EXAMPLE_TEMPLATES = {
-    'star': {
-        'basic_star': StarTemplate.create_basic_star(
-            star_id=900001,
-            name="New Frontier",
-            x=45.2,
-            y=-23.1,
-            z=67.8,
-            magnitude=4.2,
-            spectral_class="G5V"
-        ),
-        'fictional_star': StarTemplate.create_fictional_star(
-            star_id=900002,
-            system_name="Haven System",
-            fictional_name="New Eden",
-            x=78.3,
-            y=12.7,
-            z=-45.9,
-            magnitude=3.8,
-            spectral_class="F8V",
-            description="A promising system for colonization with multiple habitable worlds",
-            source="Custom Universe"
-        )
-    },
-    
-    'nation': {
-        'trading_confederation': NationTemplate.create_trading_confederation(
-            nation_id="meridian_traders",
-            name="Meridian Traders",
-            capital_system="Meridian Prime",
-            capital_star_id=900001,
-            established_year=2345,
-            member_systems=[900001, 900002, 900003],
-            trade_specialties=["Rare Metals", "Technology", "Foodstuffs"]
-        ),
-        'exploration_coalition': NationTemplate.create_exploration_coalition(
-            nation_id="frontier_explorers",
-            name="Frontier Explorers",
-            capital_system="Explorer's Rest",
-            capital_star_id=900004,
-            established_year=2356,
-            frontier_systems=[900004, 900005, 900006]
-        )
-    },
-    
-    'trade_route': {
-        'mining_route': TradeRouteTemplate.create_mining_route(
-            route_name="Asteroid Belt Express",
-            mining_system="Minerva Prime",
-            mining_star_id=900001,
-            processing_system="Industrial Complex Alpha",
-            processing_star_id=900002,
-            controlling_nation="meridian_traders",
-            ore_types=["Iron Ore", "Rare Earth Elements", "Platinum"]
-        ),
-        'passenger_route': TradeRouteTemplate.create_passenger_route(
-            route_name="Colonial Express",
-            departure_system="Old Terra",
-            departure_star_id=0,
-            destination_system="New Eden",
-            destination_star_id=900002,
-            controlling_nation="frontier_explorers",
-            service_class="Luxury"
-        )
-    },
-    
-    'planetary_system': {
-        'multi_planet_system': PlanetarySystemTemplate.create_planetary_system(
-            star_id=900001,
-            system_name="New Eden System",
-            planets=[
-                PlanetarySystemTemplate.create_planet(
-                    name="Scorcher", planet_type="Hot Terrestrial", distance_au=0.3,
-                    mass_earth=0.8, radius_earth=0.9, orbital_period_days=45,
-                    temperature_k=600, atmosphere="CO2, SO2"
-                ),
-                PlanetarySystemTemplate.create_habitable_world(
-                    name="Eden Prime", distance_au=1.2, mass_earth=1.1,
-                    radius_earth=1.05, inhabited=True, population=2500000,
-                    civilization_level="Early Industrial"
-                ),
-                PlanetarySystemTemplate.create_gas_giant(
-                    name="Guardian", distance_au=5.2, mass_earth=318,
-                    radius_earth=11.2, moon_count=16
-                )
-            ],
-            description="A promising system with one inhabited world and rich resources"
-        )
-    }
-}
\ No newline at end of file
+class _ExampleTemplates(Mapping):
+    """Example template entries, grouped by data type and built on first access"""
+    
+    _SECTIONS = ('star', 'nation', 'trade_route', 'planetary_system')
+    
+    def __getitem__(self, section: str) -> Dict:
+        if section not in self._SECTIONS:
+            raise KeyError(section)
+        return getattr(self, section)
+    
+    def __iter__(self):
+        return iter(self._SECTIONS)
+    
+    def __len__(self) -> int:
+        return len(self._SECTIONS)
+    
+    @cached_property
+    def star(self) -> Dict:
+        return {
+            'basic_star': StarTemplate.create_basic_star_dict(
+                star_id=900001,
+                name="New Frontier",
+                x=45.2,
+                y=-23.1,
+                z=67.8,
+                magnitude=4.2,
+                spectral_class="G5V"
+            ),
+            'fictional_star': StarTemplate.create_fictional_star(
+                star_id=900002,
+                system_name="Haven System",
+                fictional_name="New Eden",
+                x=78.3,
+                y=12.7,
+                z=-45.9,
+                magnitude=3.8,
+                spectral_class="F8V",
+                description="A promising system for colonization with multiple habitable worlds",
+                source="Custom Universe"
+            )
+        }
+    
+    @cached_property
+    def nation(self) -> Dict:
+        return {
+            'trading_confederation': NationTemplate.create_trading_confederation(
+                nation_id="meridian_traders",
+                name="Meridian Traders",
+                capital_system="Meridian Prime",
+                capital_star_id=900001,
+                established_year=2345,
+                member_systems=[900001, 900002, 900003],
+                trade_specialties=["Rare Metals", "Technology", "Foodstuffs"]
+            ).as_dict(),
+            'exploration_coalition': NationTemplate.create_exploration_coalition(
+                nation_id="frontier_explorers",
+                name="Frontier Explorers",
+                capital_system="Explorer's Rest",
+                capital_star_id=900004,
+                established_year=2356,
+                frontier_systems=[900004, 900005, 900006]
+            ).as_dict()
+        }
+    
+    @cached_property
+    def trade_route(self) -> Dict:
+        return {
+            'mining_route': TradeRouteTemplate.create_mining_route(
+                route_name="Asteroid Belt Express",
+                mining_system="Minerva Prime",
+                mining_star_id=900001,
+                processing_system="Industrial Complex Alpha",
+                processing_star_id=900002,
+                controlling_nation="meridian_traders",
+                ore_types=["Iron Ore", "Rare Earth Elements", "Platinum"]
+            ).as_dict(),
+            'passenger_route': TradeRouteTemplate.create_passenger_route(
+                route_name="Colonial Express",
+                departure_system="Old Terra",
+                departure_star_id=0,
+                destination_system="New Eden",
+                destination_star_id=900002,
+                controlling_nation="frontier_explorers",
+                service_class="Luxury"
+            ).as_dict()
+        }
+    
+    @cached_property
+    def planetary_system(self) -> Dict:
+        return {
+            'multi_planet_system': PlanetarySystemTemplate.create_planetary_system(
+                star_id=900001,
+                system_name="New Eden System",
+                planets=[
+                    PlanetarySystemTemplate.create_planet(
+                        name="Scorcher", planet_type="Hot Terrestrial", distance_au=0.3,
+                        mass_earth=0.8, radius_earth=0.9, orbital_period_days=45,
+                        temperature_k=600, atmosphere="CO2, SO2"
+                    ),
+                    PlanetarySystemTemplate.create_habitable_world(
+                        name="Eden Prime", distance_au=1.2, mass_earth=1.1,
+                        radius_earth=1.05, inhabited=True, population=2500000,
+                        civilization_level="Early Industrial"
+                    ),
+                    PlanetarySystemTemplate.create_gas_giant(
+                        name="Guardian", distance_au=5.2, mass_earth=318,
+                        radius_earth=11.2, moon_count=16
+                    )
+                ],
+                description="A promising system with one inhabited world and rich resources"
+            )
+        }
+
+
+EXAMPLE_TEMPLATES = _ExampleTemplates()
+
+
+@functools.lru_cache(maxsize=1)
+def get_example_templates() -> Dict:
+    """All example templates as one dict, built on the first call and reused"""
+    return dict(EXAMPLE_TEMPLATES)
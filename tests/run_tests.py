@@ -9,7 +9,6 @@ import os
 import argparse
 import unittest
 import time
-from io import StringIO
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -18,6 +17,23 @@ sys.path.insert(0, project_root)
 from tests import BaseTestCase, TEST_CONFIG
 
 
+def _iter_tests(suite):
+    """Flatten a nested TestSuite into its individual test cases"""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _test_module(test):
+    """Name of the test module a discovered test came from"""
+    if type(test).__name__ == '_FailedTest':
+        # Modules that failed to import are reported under their own name
+        return test._testMethodName.rsplit('.', 1)[-1]
+    return type(test).__module__.rsplit('.', 1)[-1]
+
+
 class TestRunner:
     """Enhanced test runner with reporting and options"""
     
@@ -25,6 +41,14 @@ class TestRunner:
         self.results = {}
         self.start_time = None
         self.end_time = None
+        self._all_tests = None
+    
+    def _discovered_tests(self):
+        """Discover every test module once and reuse the result for each category"""
+        if self._all_tests is None:
+            suite = unittest.TestLoader().discover('tests', pattern='test_*.py')
+            self._all_tests = list(_iter_tests(suite))
+        return self._all_tests
     
     def run_category(self, category, verbosity=2):
         """Run specific test category"""
@@ -32,21 +56,21 @@ class TestRunner:
         print(f"Running {category.upper()} Tests")
         print(f"{'='*60}")
         
-        loader = unittest.TestLoader()
+        try:
+            tests = self._discovered_tests()
+        except Exception as e:
+            print(f"Error loading {category} tests: {e}")
+            return False
         
         if category == 'all':
-            suite = loader.discover('tests', pattern='test_*.py')
+            suite = unittest.TestSuite(tests)
         else:
-            try:
-                suite = loader.discover('tests', pattern=f'test_{category}.py')
-            except Exception as e:
-                print(f"Error loading {category} tests: {e}")
-                return False
-        
-        # Capture output
-        stream = StringIO()
+            module_name = f'test_{category}'
+            suite = unittest.TestSuite(t for t in tests if _test_module(t) == module_name)
+        
+        # Stream results straight to the terminal; the report only needs the counts
         runner = unittest.TextTestRunner(
-            stream=stream,
+            stream=sys.stdout,
             verbosity=verbosity,
             buffer=True
         )
@@ -62,13 +86,9 @@ class TestRunner:
             'errors': len(result.errors),
             'skipped': len(result.skipped) if hasattr(result, 'skipped') else 0,
             'time': end_time - start_time,
-            'success': result.wasSuccessful(),
-            'output': stream.getvalue()
+            'success': result.wasSuccessful()
         }
         
-        # Print results
-        print(stream.getvalue())
-        
         return result.wasSuccessful()
     
     def run_performance_tests(self):
@@ -3,10 +3,10 @@ Unit tests for API endpoints and Flask application
 """
 
 import unittest
-import json
+import importlib
 import os
 import sys
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # Add project paths
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -14,28 +14,63 @@ sys.path.insert(0, project_root)
 
 from tests import BaseTestCase
 
+# Payload for the response-time test, built once at import
+_STAR_1000 = [{'id': i, 'name': f'Star {i}'} for i in range(1000)]
 
-class TestAPIEndpoints(BaseTestCase):
-    """Test Flask API endpoints"""
+
+# Resolved once at import: the MontyDB version first, then the regular one
+_APP_MODULE = None
+for _name in ('app_montydb', 'app'):
+    try:
+        _APP_MODULE = importlib.import_module(_name)
+        break
+    except ImportError:
+        continue
+
+
+class FlaskAppMixin:
+    """Shared Flask app, test client and class-level patchers for API tests"""
+    
+    requires_montydb = False
+    _patch_targets = {}
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        
+        if _APP_MODULE is None:
+            raise unittest.SkipTest("Flask app not available")
+        if cls.requires_montydb and _APP_MODULE.__name__ != 'app_montydb':
+            raise unittest.SkipTest("MontyDB app not available")
+        
+        cls.app = _APP_MODULE.app
+        cls.app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+        # No test relies on cookies, so one stateless client serves the class
+        cls.client = cls.app.test_client(use_cookies=False)
+        
+        # Patch every target until the class finishes
+        for attr, target in cls._patch_targets.items():
+            patcher = patch(target)
+            setattr(cls, attr, patcher.start())
+            cls.addClassCleanup(patcher.stop)
     
     def setUp(self):
         super().setUp()
         
-        try:
-            # Try to import the MontyDB version first
-            import app_montydb
-            self.app = app_montydb.app
-        except ImportError:
-            try:
-                # Fall back to regular version
-                import app
-                self.app = app.app
-            except ImportError:
-                self.skipTest("Flask app not available")
-        
-        self.app.config['TESTING'] = True
-        self.app.config['WTF_CSRF_ENABLED'] = False
-        self.client = self.app.test_client()
+        # Give each class-level mock a fresh return value for this test
+        for attr in self._patch_targets:
+            getattr(self, attr).reset_mock(return_value=True)
+
+
+class TestAPIEndpoints(FlaskAppMixin, BaseTestCase):
+    """Test Flask API endpoints"""
+    
+    _patch_targets = {
+        'mock_star_controller': 'controllers.star_controller.StarController',
+        'mock_nation_controller': 'controllers.nation_controller.NationController',
+        'mock_planet_controller': 'controllers.planet_controller.PlanetController',
+        'mock_region_controller': 'controllers.stellar_region_controller.StellarRegionController',
+    }
     
     def test_home_page(self):
         """Test home page loads"""
@@ -46,146 +81,130 @@ class TestAPIEndpoints(BaseTestCase):
     
     def test_api_stars_endpoint(self):
         """Test /api/stars endpoint"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_stars.return_value = [
-                {'id': 0, 'name': 'Sol', 'x': 0, 'y': 0, 'z': 0, 'mag': -26.7},
-                {'id': 71456, 'name': 'Alpha Centauri A', 'x': -1.34, 'y': -0.20, 'z': -1.17, 'mag': -0.27}
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/stars')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('stars', data)
-            self.assertEqual(len(data['stars']), 2)
-            self.assertEqual(data['stars'][0]['name'], 'Sol')
+        controller = self.mock_star_controller.return_value
+        controller.get_all_stars.return_value = [
+            {'id': 0, 'name': 'Sol', 'x': 0, 'y': 0, 'z': 0, 'mag': -26.7},
+            {'id': 71456, 'name': 'Alpha Centauri A', 'x': -1.34, 'y': -0.20, 'z': -1.17, 'mag': -0.27}
+        ]
+        
+        response = self.client.get('/api/stars')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('stars', data)
+        self.assertEqual(len(data['stars']), 2)
+        self.assertEqual(data['stars'][0]['name'], 'Sol')
     
     def test_api_stars_with_filters(self):
         """Test /api/stars endpoint with filters"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_stars.return_value = [
-                {'id': 0, 'name': 'Sol', 'mag': 4.8}
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/stars?mag_limit=5.0&count_limit=100')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('stars', data)
+        controller = self.mock_star_controller.return_value
+        controller.get_all_stars.return_value = [
+            {'id': 0, 'name': 'Sol', 'mag': 4.8}
+        ]
+        
+        response = self.client.get('/api/stars?mag_limit=5.0&count_limit=100')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('stars', data)
     
     def test_api_star_by_id(self):
         """Test /api/star/<id> endpoint"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_star_by_id.return_value = {
-                'id': 0,
-                'name': 'Sol',
-                'mag': -26.7,
-                'spect': 'G2V'
-            }
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/star/0')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['id'], 0)
-            self.assertEqual(data['name'], 'Sol')
+        controller = self.mock_star_controller.return_value
+        controller.get_star_by_id.return_value = {
+            'id': 0,
+            'name': 'Sol',
+            'mag': -26.7,
+            'spect': 'G2V'
+        }
+        
+        response = self.client.get('/api/star/0')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['id'], 0)
+        self.assertEqual(data['name'], 'Sol')
     
     def test_api_star_not_found(self):
         """Test /api/star/<id> endpoint with non-existent star"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_star_by_id.return_value = None
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/star/999999')
-            
-            self.assertEqual(response.status_code, 404)
-            data = json.loads(response.data)
-            self.assertIn('error', data)
+        controller = self.mock_star_controller.return_value
+        controller.get_star_by_id.return_value = None
+        
+        response = self.client.get('/api/star/999999')
+        
+        self.assertEqual(response.status_code, 404)
+        data = response.get_json()
+        self.assertIn('error', data)
     
     def test_api_search_endpoint(self):
         """Test /api/search endpoint"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.search_stars.return_value = [
-                {'id': 32263, 'name': 'Sirius', 'mag': -1.46}
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/search?q=Sirius')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('results', data)
-            self.assertEqual(len(data['results']), 1)
-            self.assertEqual(data['results'][0]['name'], 'Sirius')
+        controller = self.mock_star_controller.return_value
+        controller.search_stars.return_value = [
+            {'id': 32263, 'name': 'Sirius', 'mag': -1.46}
+        ]
+        
+        response = self.client.get('/api/search?q=Sirius')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('results', data)
+        self.assertEqual(len(data['results']), 1)
+        self.assertEqual(data['results'][0]['name'], 'Sirius')
     
     def test_api_search_empty_query(self):
         """Test /api/search endpoint with empty query"""
         response = self.client.get('/api/search?q=')
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('error', data)
     
     def test_api_nations_endpoint(self):
         """Test /api/nations endpoint"""
-        with patch('controllers.nation_controller.NationController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_nations.return_value = [
-                {
-                    'id': 'terran_directorate',
-                    'name': 'Terran Directorate',
-                    'government_type': 'Authoritarian Republic'
-                }
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/nations')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('nations', data)
-            self.assertEqual(len(data['nations']), 1)
-            self.assertEqual(data['nations'][0]['name'], 'Terran Directorate')
-    
-    def test_api_nation_by_id(self):
-        """Test /api/nation/<id> endpoint"""
-        with patch('controllers.nation_controller.NationController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_nation_by_id.return_value = {
+        controller = self.mock_nation_controller.return_value
+        controller.get_all_nations.return_value = [
+            {
                 'id': 'terran_directorate',
                 'name': 'Terran Directorate',
-                'territories': [0, 71456, 32263]
+                'government_type': 'Authoritarian Republic'
             }
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/nation/terran_directorate')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['id'], 'terran_directorate')
-            self.assertEqual(len(data['territories']), 3)
+        ]
+        
+        response = self.client.get('/api/nations')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('nations', data)
+        self.assertEqual(len(data['nations']), 1)
+        self.assertEqual(data['nations'][0]['name'], 'Terran Directorate')
+    
+    def test_api_nation_by_id(self):
+        """Test /api/nation/<id> endpoint"""
+        controller = self.mock_nation_controller.return_value
+        controller.get_nation_by_id.return_value = {
+            'id': 'terran_directorate',
+            'name': 'Terran Directorate',
+            'territories': [0, 71456, 32263]
+        }
+        
+        response = self.client.get('/api/nation/terran_directorate')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['id'], 'terran_directorate')
+        self.assertEqual(len(data['territories']), 3)
     
     def test_api_nation_territories(self):
         """Test /api/nation/<id>/territories endpoint"""
-        with patch('controllers.nation_controller.NationController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_nation_territories.return_value = [0, 71456, 32263]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/nation/terran_directorate/territories')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('territories', data)
-            self.assertEqual(len(data['territories']), 3)
+        controller = self.mock_nation_controller.return_value
+        controller.get_nation_territories.return_value = [0, 71456, 32263]
+        
+        response = self.client.get('/api/nation/terran_directorate/territories')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('territories', data)
+        self.assertEqual(len(data['territories']), 3)
     
     def test_api_trade_routes_endpoint(self):
         """Test /api/trade-routes endpoint"""
@@ -202,47 +221,43 @@ class TestAPIEndpoints(BaseTestCase):
             response = self.client.get('/api/trade-routes')
             
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
             self.assertIn('trade_routes', data)
     
     def test_api_planetary_systems_endpoint(self):
         """Test /api/systems endpoint"""
-        with patch('controllers.planet_controller.PlanetController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_systems.return_value = [
-                {
-                    'star_id': 48941,
-                    'system_name': 'Holsten Tor',
-                    'total_planets': 5
-                }
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/systems')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('systems', data)
-    
-    def test_api_system_by_star_id(self):
-        """Test /api/system/<star_id> endpoint"""
-        with patch('controllers.planet_controller.PlanetController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_planetary_system.return_value = {
+        controller = self.mock_planet_controller.return_value
+        controller.get_all_systems.return_value = [
+            {
                 'star_id': 48941,
                 'system_name': 'Holsten Tor',
-                'planets': [
-                    {'name': 'Stahlburgh', 'type': 'Terrestrial'}
-                ]
+                'total_planets': 5
             }
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/system/48941')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertEqual(data['star_id'], 48941)
-            self.assertEqual(len(data['planets']), 1)
+        ]
+        
+        response = self.client.get('/api/systems')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('systems', data)
+    
+    def test_api_system_by_star_id(self):
+        """Test /api/system/<star_id> endpoint"""
+        controller = self.mock_planet_controller.return_value
+        controller.get_planetary_system.return_value = {
+            'star_id': 48941,
+            'system_name': 'Holsten Tor',
+            'planets': [
+                {'name': 'Stahlburgh', 'type': 'Terrestrial'}
+            ]
+        }
+        
+        response = self.client.get('/api/system/48941')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['star_id'], 48941)
+        self.assertEqual(len(data['planets']), 1)
     
     def test_api_galactic_directions(self):
         """Test /api/galactic-directions endpoint"""
@@ -254,44 +269,40 @@ class TestAPIEndpoints(BaseTestCase):
             response = self.client.get('/api/galactic-directions')
             
             self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
+            data = response.get_json()
             self.assertIn('directions', data)
     
     def test_api_stellar_regions(self):
         """Test /api/stellar-regions endpoint"""
-        with patch('controllers.stellar_region_controller.StellarRegionController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_regions.return_value = [
-                {'name': 'Sol Region', 'color': '#FF0000'}
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/stellar-regions')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('regions', data)
+        controller = self.mock_region_controller.return_value
+        controller.get_all_regions.return_value = [
+            {'name': 'Sol Region', 'color': '#FF0000'}
+        ]
+        
+        response = self.client.get('/api/stellar-regions')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('regions', data)
     
     def test_api_distance_calculation(self):
         """Test /api/distance endpoint"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.calculate_distance.return_value = 4.37
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/api/distance?star1=0&star2=71456')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('distance', data)
-            self.assertEqual(data['distance'], 4.37)
+        controller = self.mock_star_controller.return_value
+        controller.calculate_distance.return_value = 4.37
+        
+        response = self.client.get('/api/distance?star1=0&star2=71456')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('distance', data)
+        self.assertEqual(data['distance'], 4.37)
     
     def test_api_distance_missing_parameters(self):
         """Test /api/distance endpoint with missing parameters"""
         response = self.client.get('/api/distance?star1=0')
         
         self.assertEqual(response.status_code, 400)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('error', data)
     
     def test_api_spectral_types(self):
@@ -299,81 +310,45 @@ class TestAPIEndpoints(BaseTestCase):
         response = self.client.get('/api/spectral-types')
         
         self.assertEqual(response.status_code, 200)
-        data = json.loads(response.data)
+        data = response.get_json()
         self.assertIn('spectral_types', data)
         self.assertIn('O', data['spectral_types'])
         self.assertIn('G', data['spectral_types'])
     
     def test_export_csv_endpoint(self):
         """Test /export/csv endpoint"""
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_stars.return_value = [
-                {'id': 0, 'name': 'Sol', 'x': 0, 'y': 0, 'z': 0}
-            ]
-            mock_controller.return_value = mock_instance
-            
-            response = self.client.get('/export/csv')
-            
-            self.assertEqual(response.status_code, 200)
-            self.assertEqual(response.headers['Content-Type'], 'text/csv; charset=utf-8')
-            self.assertIn(b'Sol', response.data)
+        controller = self.mock_star_controller.return_value
+        controller.get_all_stars.return_value = [
+            {'id': 0, 'name': 'Sol', 'x': 0, 'y': 0, 'z': 0}
+        ]
+        
+        response = self.client.get('/export/csv')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Type'], 'text/csv; charset=utf-8')
+        # Scan the body chunk by chunk rather than joining it into one bytes object
+        self.assertTrue(any(b'Sol' in chunk for chunk in response.iter_encoded()))
 
 
-class TestAPIValidation(BaseTestCase):
+class TestAPIValidation(FlaskAppMixin, BaseTestCase):
     """Test API input validation and error handling"""
     
-    def setUp(self):
-        super().setUp()
-        
-        try:
-            import app_montydb
-            self.app = app_montydb.app
-        except ImportError:
-            try:
-                import app
-                self.app = app.app
-            except ImportError:
-                self.skipTest("Flask app not available")
-        
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
-    
-    def test_invalid_star_id_format(self):
-        """Test API with invalid star ID format"""
-        response = self.client.get('/api/star/invalid_id')
-        
-        # Should handle gracefully
-        self.assertIn(response.status_code, [400, 404])
-    
-    def test_negative_star_id(self):
-        """Test API with negative star ID"""
-        response = self.client.get('/api/star/-1')
-        
-        # Should handle gracefully
-        self.assertIn(response.status_code, [400, 404])
-    
-    def test_invalid_magnitude_parameters(self):
-        """Test API with invalid magnitude parameters"""
-        response = self.client.get('/api/stars?mag_limit=invalid')
-        
-        # Should handle gracefully or use defaults
-        self.assertIn(response.status_code, [200, 400])
-    
-    def test_invalid_count_limit(self):
-        """Test API with invalid count limit"""
-        response = self.client.get('/api/stars?count_limit=-1')
-        
-        # Should handle gracefully or use defaults
-        self.assertIn(response.status_code, [200, 400])
-    
-    def test_sql_injection_attempt(self):
-        """Test API protection against SQL injection"""
-        malicious_query = "'; DROP TABLE stars; --"
-        response = self.client.get(f'/api/search?q={malicious_query}')
-        
-        # Should handle safely
-        self.assertIn(response.status_code, [200, 400])
+    # (url, acceptable status codes) for requests that must fail gracefully
+    # or fall back to defaults instead of erroring
+    _MALFORMED_REQUESTS = (
+        ('/api/star/invalid_id', (400, 404)),
+        ('/api/star/-1', (400, 404)),
+        ('/api/stars?mag_limit=invalid', (200, 400)),
+        ('/api/stars?count_limit=-1', (200, 400)),
+        ("/api/search?q='; DROP TABLE stars; --", (200, 400)),
+    )
+    
+    def test_malformed_requests_handled(self):
+        """Test API with invalid IDs, parameters and injection attempts"""
+        for url, allowed in self._MALFORMED_REQUESTS:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertIn(response.status_code, allowed)
     
     def test_xss_attempt(self):
         """Test API protection against XSS"""
@@ -387,74 +362,39 @@ class TestAPIValidation(BaseTestCase):
             self.assertNotIn(b'<script>', response.data)
 
 
-class TestAPIPerformance(BaseTestCase):
+class TestAPIPerformance(FlaskAppMixin, BaseTestCase):
     """Test API performance characteristics"""
     
-    def setUp(self):
-        super().setUp()
-        
-        try:
-            import app_montydb
-            self.app = app_montydb.app
-        except ImportError:
-            try:
-                import app
-                self.app = app.app
-            except ImportError:
-                self.skipTest("Flask app not available")
-        
-        self.app.config['TESTING'] = True
-        self.client = self.app.test_client()
+    _patch_targets = {
+        'mock_star_controller': 'controllers.star_controller.StarController',
+    }
     
     def test_api_response_time(self):
         """Test API response times are reasonable"""
-        import time
+        controller = self.mock_star_controller.return_value
+        controller.get_all_stars.return_value = _STAR_1000
         
-        with patch('controllers.star_controller.StarController') as mock_controller:
-            mock_instance = MagicMock()
-            mock_instance.get_all_stars.return_value = [
-                {'id': i, 'name': f'Star {i}'} for i in range(1000)
-            ]
-            mock_controller.return_value = mock_instance
-            
-            start_time = time.time()
-            response = self.client.get('/api/stars')
-            end_time = time.time()
-            
-            response_time_ms = (end_time - start_time) * 1000
-            
-            self.assertEqual(response.status_code, 200)
-            self.assertLess(response_time_ms, 2000, "API response too slow")
+        # Warm up once so one-off first-request setup is not timed
+        self.client.get('/api/stars')
+        
+        response = self.assertPerformance(
+            lambda: self.client.get('/api/stars'), max_time_ms=2000
+        )
+        
+        self.assertEqual(response.status_code, 200)
     
     def test_concurrent_requests(self):
         """Test handling of concurrent requests"""
-        import threading
-        import queue
+        from concurrent.futures import ThreadPoolExecutor
         
-        results = queue.Queue()
-        
-        def make_request():
+        def make_request(_):
             try:
-                response = self.client.get('/api/spectral-types')
-                results.put(response.status_code)
+                return self.client.get('/api/spectral-types').status_code
             except Exception as e:
-                results.put(str(e))
-        
-        # Create multiple threads
-        threads = []
-        for _ in range(10):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-            thread.start()
+                return str(e)
         
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
-        
-        # Check results
-        status_codes = []
-        while not results.empty():
-            status_codes.append(results.get())
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            status_codes = list(executor.map(make_request, range(10)))
         
         # All requests should succeed
         self.assertEqual(len(status_codes), 10)
@@ -462,82 +402,69 @@ class TestAPIPerformance(BaseTestCase):
             self.assertEqual(status, 200)
 
 
-class TestAPIMontyDBFeatures(BaseTestCase):
+class TestAPIMontyDBFeatures(FlaskAppMixin, BaseTestCase):
     """Test MontyDB-specific API features"""
     
-    def setUp(self):
-        super().setUp()
-        
-        try:
-            import app_montydb
-            self.app = app_montydb.app
-            self.app.config['TESTING'] = True
-            self.client = self.app.test_client()
-        except ImportError:
-            self.skipTest("MontyDB app not available")
+    requires_montydb = True
+    
+    _patch_targets = {
+        'mock_data_manager': 'managers.data_manager.DataManager',
+    }
     
     def test_api_stats_stars(self):
         """Test /api/stats/stars endpoint"""
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.get_star_statistics.return_value = {
-                'total_stars': 24671,
-                'real_stars': 24658,
-                'fictional_stars': 13
-            }
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.get('/api/stats/stars')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('total_stars', data)
+        manager = self.mock_data_manager.return_value
+        manager.get_star_statistics.return_value = {
+            'total_stars': 24671,
+            'real_stars': 24658,
+            'fictional_stars': 13
+        }
+        
+        response = self.client.get('/api/stats/stars')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('total_stars', data)
     
     def test_api_stars_region(self):
         """Test /api/stars/region/<region_name> endpoint"""
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.search_stars.return_value = [
-                {'id': 0, 'name': 'Sol'}
-            ]
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.get('/api/stars/region/sol_region')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('stars', data)
+        manager = self.mock_data_manager.return_value
+        manager.search_stars.return_value = [
+            {'id': 0, 'name': 'Sol'}
+        ]
+        
+        response = self.client.get('/api/stars/region/sol_region')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('stars', data)
     
     def test_api_stars_nation(self):
         """Test /api/stars/nation/<nation_id> endpoint"""
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.search_stars.return_value = [
-                {'id': 0, 'name': 'Sol', 'nation_id': 'terran_directorate'}
-            ]
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.get('/api/stars/nation/terran_directorate')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('stars', data)
+        manager = self.mock_data_manager.return_value
+        manager.search_stars.return_value = [
+            {'id': 0, 'name': 'Sol', 'nation_id': 'terran_directorate'}
+        ]
+        
+        response = self.client.get('/api/stars/nation/terran_directorate')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('stars', data)
     
     def test_api_network_analysis(self):
         """Test /api/network-analysis endpoint"""
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.analyze_trade_network.return_value = {
-                'summary': {'total_routes': 28, 'network_density': 0.75},
-                'hub_systems': []
-            }
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.get('/api/network-analysis')
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('summary', data)
+        manager = self.mock_data_manager.return_value
+        manager.analyze_trade_network.return_value = {
+            'summary': {'total_routes': 28, 'network_density': 0.75},
+            'hub_systems': []
+        }
+        
+        response = self.client.get('/api/network-analysis')
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('summary', data)
     
     def test_post_star_add(self):
         """Test POST /api/star/add endpoint"""
@@ -548,22 +475,16 @@ class TestAPIMontyDBFeatures(BaseTestCase):
             'name': 'Test Star'
         }
         
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.add_star.return_value = 999001
-            mock_instance.validate_star_data.return_value = []
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.post(
-                '/api/star/add',
-                data=json.dumps(star_data),
-                content_type='application/json'
-            )
-            
-            self.assertEqual(response.status_code, 201)
-            data = json.loads(response.data)
-            self.assertIn('star_id', data)
-            self.assertEqual(data['star_id'], 999001)
+        manager = self.mock_data_manager.return_value
+        manager.add_star.return_value = 999001
+        manager.validate_star_data.return_value = []
+        
+        response = self.client.post('/api/star/add', json=star_data)
+        
+        self.assertEqual(response.status_code, 201)
+        data = response.get_json()
+        self.assertIn('star_id', data)
+        self.assertEqual(data['star_id'], 999001)
     
     def test_put_star_update(self):
         """Test PUT /api/star/<id>/update endpoint"""
@@ -572,21 +493,15 @@ class TestAPIMontyDBFeatures(BaseTestCase):
             'fictional_description': 'Updated description'
         }
         
-        with patch('managers.data_manager.DataManager') as mock_manager:
-            mock_instance = MagicMock()
-            mock_instance.update_star.return_value = True
-            mock_manager.return_value = mock_instance
-            
-            response = self.client.put(
-                '/api/star/999001/update',
-                data=json.dumps(update_data),
-                content_type='application/json'
-            )
-            
-            self.assertEqual(response.status_code, 200)
-            data = json.loads(response.data)
-            self.assertIn('success', data)
-            self.assertTrue(data['success'])
+        manager = self.mock_data_manager.return_value
+        manager.update_star.return_value = True
+        
+        response = self.client.put('/api/star/999001/update', json=update_data)
+        
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertIn('success', data)
+        self.assertTrue(data['success'])
 
 
 if __name__ == '__main__':
@@ -5,70 +5,104 @@ Unit tests for all controller classes
 import unittest
 import os
 import sys
-from unittest.mock import patch, MagicMock
+from types import MappingProxyType
+from unittest.mock import patch, MagicMock, call
 
-# Add project paths
+# Add project root so the file also runs directly; controllers and models
+# are imported as packages from there
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
-sys.path.insert(0, os.path.join(project_root, 'controllers'))
-sys.path.insert(0, os.path.join(project_root, 'models'))
 
-from tests import BaseTestCase
+from tests import BaseTestCase, import_optional
 
+BaseController = import_optional('controllers.base_controller.BaseController')
+StarController = import_optional('controllers.star_controller.StarController')
+NationController = import_optional('controllers.nation_controller.NationController')
+PlanetController = import_optional('controllers.planet_controller.PlanetController')
+MapController = import_optional('controllers.map_controller.MapController')
+StellarRegionController = import_optional(
+    'controllers.stellar_region_controller.StellarRegionController'
+)
 
+# Read-only records shared by the mocked models; immutable so no test can
+# leak changes into another
+_SOL = MappingProxyType({'id': 0, 'name': 'Sol'})
+_ALPHA_CENTAURI_A = MappingProxyType({'id': 71456, 'name': 'Alpha Centauri A'})
+_SIRIUS = MappingProxyType({'id': 32263, 'name': 'Sirius'})
+_TERRAN_DIRECTORATE = MappingProxyType({'id': 'terran_directorate', 'name': 'Terran Directorate'})
+_FELGENLAND_UNION = MappingProxyType({'id': 'felgenland_union', 'name': 'Felgenland Union'})
+
+# Large mocked dataset for the performance tests, built once at import
+_LARGE_STAR_DATASET = tuple({'id': i, 'name': f'Star {i}'} for i in range(10000))
+
+
+def _start_class_patch(cls, target):
+    """Patch target until the test class finishes and return the mock"""
+    patcher = patch(target)
+    mock = patcher.start()
+    cls.addClassCleanup(patcher.stop)
+    return mock
+
+
+class ControllerTestMixin:
+    """Patch a controller's model classes once per class and build the
+    controller against fresh model mocks for every test"""
+    
+    controller_cls = None
+    controller_attr = 'controller'
+    # Test attribute holding the model mock -> model class to patch
+    model_patches = {}
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._model_classes = {
+            attr: _start_class_patch(cls, target)
+            for attr, target in cls.model_patches.items()
+        }
+    
+    def setUp(self):
+        super().setUp()
+        
+        for attr, model_cls in self._model_classes.items():
+            model_cls.return_value = MagicMock()
+            setattr(self, attr, model_cls.return_value)
+        
+        setattr(self, self.controller_attr, self.controller_cls())
+
+
+@unittest.skipIf(BaseController is None, "BaseController not available")
 class TestBaseController(BaseTestCase):
     """Test base controller functionality"""
     
     def test_base_controller_import(self):
         """Test that base controller can be imported"""
-        try:
-            from controllers.base_controller import BaseController
-            self.assertTrue(hasattr(BaseController, '__init__'))
-        except ImportError:
-            self.skipTest("BaseController not available")
+        self.assertTrue(hasattr(BaseController, '__init__'))
     
     def test_base_controller_initialization(self):
         """Test base controller initialization"""
-        try:
-            from controllers.base_controller import BaseController
-            controller = BaseController()
-            self.assertIsNotNone(controller)
-        except ImportError:
-            self.skipTest("BaseController not available")
+        controller = BaseController()
+        self.assertIsNotNone(controller)
 
 
-class TestStarController(BaseTestCase):
+@unittest.skipIf(StarController is None, "StarController not available")
+class TestStarController(ControllerTestMixin, BaseTestCase):
     """Test star controller functionality"""
     
-    @patch('models.star_model.StarModel')
-    @patch('models.star_model_db.StarModelDB')
-    def setUp(self, mock_star_model_db, mock_star_model):
-        super().setUp()
-        
-        # Mock both models
-        self.mock_star_model = MagicMock()
-        self.mock_star_model_db = MagicMock()
-        
-        mock_star_model.return_value = self.mock_star_model
-        mock_star_model_db.return_value = self.mock_star_model_db
-        
-        try:
-            from controllers.star_controller import StarController
-            self.star_controller = StarController()
-        except ImportError:
-            self.skipTest("StarController not available")
+    controller_cls = StarController
+    controller_attr = 'star_controller'
+    model_patches = {
+        'mock_star_model': 'models.star_model.StarModel',
+        'mock_star_model_db': 'models.star_model_db.StarModelDB',
+    }
     
     def test_get_all_stars(self):
         """Test getting all stars through controller"""
-        mock_stars = [
-            {'id': 0, 'name': 'Sol'},
-            {'id': 71456, 'name': 'Alpha Centauri A'}
-        ]
-        self.mock_star_model.get_all_stars.return_value = mock_stars
+        self.mock_star_model.get_all_stars.return_value = (_SOL, _ALPHA_CENTAURI_A)
         
         result = self.star_controller.get_all_stars()
         
-        self.mock_star_model.get_all_stars.assert_called_once()
+        self.assertEqual(self.mock_star_model.get_all_stars.call_count, 1)
         self.assertEqual(len(result), 2)
         self.assertEqual(result[0]['name'], 'Sol')
     
@@ -79,17 +113,16 @@ class TestStarController(BaseTestCase):
         
         result = self.star_controller.get_star_by_id(0)
         
-        self.mock_star_model.get_star_by_id.assert_called_once_with(0)
+        self.assertEqual(self.mock_star_model.get_star_by_id.call_args_list, [call(0)])
         self.assertEqual(result['name'], 'Sol')
     
     def test_search_stars(self):
         """Test searching stars through controller"""
-        mock_results = [{'id': 32263, 'name': 'Sirius'}]
-        self.mock_star_model.search_stars.return_value = mock_results
+        self.mock_star_model.search_stars.return_value = (_SIRIUS,)
         
         result = self.star_controller.search_stars('Sirius')
         
-        self.mock_star_model.search_stars.assert_called_once_with('Sirius')
+        self.assertEqual(self.mock_star_model.search_stars.call_args_list, [call('Sirius')])
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]['name'], 'Sirius')
     
@@ -103,7 +136,7 @@ class TestStarController(BaseTestCase):
         
         result = self.star_controller.filter_stars_by_magnitude(min_mag=-30, max_mag=0)
         
-        self.mock_star_model.filter_by_magnitude.assert_called_once()
+        self.assertEqual(self.mock_star_model.filter_by_magnitude.call_count, 1)
         self.assertEqual(len(result), 2)
     
     def test_filter_stars_by_spectral_type(self):
@@ -113,7 +146,7 @@ class TestStarController(BaseTestCase):
         
         result = self.star_controller.filter_stars_by_spectral_type(['G'])
         
-        self.mock_star_model.filter_by_spectral_type.assert_called_once_with(['G'])
+        self.assertEqual(self.mock_star_model.filter_by_spectral_type.call_args_list, [call(['G'])])
         self.assertEqual(len(result), 1)
     
     def test_get_stars_in_range(self):
@@ -123,7 +156,7 @@ class TestStarController(BaseTestCase):
         
         result = self.star_controller.get_stars_in_range(0, 0, 0, 10)
         
-        self.mock_star_model.get_stars_in_range.assert_called_once_with(0, 0, 0, 10)
+        self.assertEqual(self.mock_star_model.get_stars_in_range.call_args_list, [call(0, 0, 0, 10)])
         self.assertEqual(len(result), 1)
     
     def test_calculate_distance(self):
@@ -132,7 +165,7 @@ class TestStarController(BaseTestCase):
         
         result = self.star_controller.calculate_distance(0, 71456)
         
-        self.mock_star_model.calculate_distance.assert_called_once_with(0, 71456)
+        self.assertEqual(self.mock_star_model.calculate_distance.call_args_list, [call(0, 71456)])
         self.assertEqual(result, 4.37)
     
     def test_get_star_statistics(self):
@@ -142,44 +175,33 @@ class TestStarController(BaseTestCase):
             'real_stars': 24658,
             'fictional_stars': 13
         }
-        self.mock_star_model.get_statistics.return_value = mock_stats
+        self.mock_star_model.get_statistics = lambda: mock_stats
         
         result = self.star_controller.get_star_statistics()
         
         self.assertEqual(result['total_stars'], 24671)
 
 
-class TestNationController(BaseTestCase):
+@unittest.skipIf(NationController is None, "NationController not available")
+class TestNationController(ControllerTestMixin, BaseTestCase):
     """Test nation controller functionality"""
     
-    @patch('models.nation_model.NationModel')
-    @patch('models.nation_model_db.NationModelDB')
-    def setUp(self, mock_nation_model_db, mock_nation_model):
-        super().setUp()
-        
-        self.mock_nation_model = MagicMock()
-        self.mock_nation_model_db = MagicMock()
-        
-        mock_nation_model.return_value = self.mock_nation_model
-        mock_nation_model_db.return_value = self.mock_nation_model_db
-        
-        try:
-            from controllers.nation_controller import NationController
-            self.nation_controller = NationController()
-        except ImportError:
-            self.skipTest("NationController not available")
+    controller_cls = NationController
+    controller_attr = 'nation_controller'
+    model_patches = {
+        'mock_nation_model': 'models.nation_model.NationModel',
+        'mock_nation_model_db': 'models.nation_model_db.NationModelDB',
+    }
     
     def test_get_all_nations(self):
         """Test getting all nations through controller"""
-        mock_nations = [
-            {'id': 'terran_directorate', 'name': 'Terran Directorate'},
-            {'id': 'felgenland_union', 'name': 'Felgenland Union'}
-        ]
-        self.mock_nation_model.get_all_nations.return_value = mock_nations
+        self.mock_nation_model.get_all_nations.return_value = (
+            _TERRAN_DIRECTORATE, _FELGENLAND_UNION
+        )
         
         result = self.nation_controller.get_all_nations()
         
-        self.mock_nation_model.get_all_nations.assert_called_once()
+        self.assertEqual(self.mock_nation_model.get_all_nations.call_count, 1)
         self.assertEqual(len(result), 2)
     
     def test_get_nation_by_id(self):
@@ -193,7 +215,7 @@ class TestNationController(BaseTestCase):
         
         result = self.nation_controller.get_nation_by_id('terran_directorate')
         
-        self.mock_nation_model.get_nation_by_id.assert_called_once_with('terran_directorate')
+        self.assertEqual(self.mock_nation_model.get_nation_by_id.call_args_list, [call('terran_directorate')])
         self.assertEqual(result['name'], 'Terran Directorate')
     
     def test_get_nation_territories(self):
@@ -203,18 +225,17 @@ class TestNationController(BaseTestCase):
         
         result = self.nation_controller.get_nation_territories('terran_directorate')
         
-        self.mock_nation_model.get_nation_territories.assert_called_once_with('terran_directorate')
+        self.assertEqual(self.mock_nation_model.get_nation_territories.call_args_list, [call('terran_directorate')])
         self.assertEqual(len(result), 3)
         self.assertIn(0, result)  # Sol
     
     def test_find_nation_by_star(self):
         """Test finding nation controlling a star through controller"""
-        mock_nation = {'id': 'terran_directorate', 'name': 'Terran Directorate'}
-        self.mock_nation_model.find_nation_by_star.return_value = mock_nation
+        self.mock_nation_model.find_nation_by_star.return_value = _TERRAN_DIRECTORATE
         
         result = self.nation_controller.find_nation_by_star(0)  # Sol
         
-        self.mock_nation_model.find_nation_by_star.assert_called_once_with(0)
+        self.assertEqual(self.mock_nation_model.find_nation_by_star.call_args_list, [call(0)])
         self.assertEqual(result['id'], 'terran_directorate')
     
     def test_get_nation_statistics(self):
@@ -224,28 +245,22 @@ class TestNationController(BaseTestCase):
             'total_controlled_systems': 15,
             'largest_nation': 'terran_directorate'
         }
-        self.mock_nation_model.get_statistics.return_value = mock_stats
+        self.mock_nation_model.get_statistics = lambda: mock_stats
         
         result = self.nation_controller.get_nation_statistics()
         
         self.assertEqual(result['total_nations'], 5)
 
 
-class TestPlanetController(BaseTestCase):
+@unittest.skipIf(PlanetController is None, "PlanetController not available")
+class TestPlanetController(ControllerTestMixin, BaseTestCase):
     """Test planet controller functionality"""
     
-    @patch('models.planet_model.PlanetModel')
-    def setUp(self, mock_planet_model):
-        super().setUp()
-        
-        self.mock_planet_model = MagicMock()
-        mock_planet_model.return_value = self.mock_planet_model
-        
-        try:
-            from controllers.planet_controller import PlanetController
-            self.planet_controller = PlanetController()
-        except ImportError:
-            self.skipTest("PlanetController not available")
+    controller_cls = PlanetController
+    controller_attr = 'planet_controller'
+    model_patches = {
+        'mock_planet_model': 'models.planet_model.PlanetModel',
+    }
     
     def test_get_planetary_system(self):
         """Test getting planetary system through controller"""
@@ -260,7 +275,7 @@ class TestPlanetController(BaseTestCase):
         
         result = self.planet_controller.get_planetary_system(999001)
         
-        self.mock_planet_model.get_planetary_system.assert_called_once_with(999001)
+        self.assertEqual(self.mock_planet_model.get_planetary_system.call_args_list, [call(999001)])
         self.assertEqual(result['system_name'], 'Test System')
     
     def test_get_all_systems(self):
@@ -273,7 +288,7 @@ class TestPlanetController(BaseTestCase):
         
         result = self.planet_controller.get_all_systems()
         
-        self.mock_planet_model.get_all_systems.assert_called_once()
+        self.assertEqual(self.mock_planet_model.get_all_systems.call_count, 1)
         self.assertEqual(len(result), 2)
     
     def test_get_habitable_planets(self):
@@ -286,7 +301,7 @@ class TestPlanetController(BaseTestCase):
         
         result = self.planet_controller.get_habitable_planets(999001)
         
-        self.mock_planet_model.get_habitable_planets.assert_called_once_with(999001)
+        self.assertEqual(self.mock_planet_model.get_habitable_planets.call_args_list, [call(999001)])
         self.assertEqual(len(result), 2)
     
     def test_add_planet_to_system(self):
@@ -301,32 +316,25 @@ class TestPlanetController(BaseTestCase):
         
         result = self.planet_controller.add_planet_to_system(999001, planet_data)
         
-        self.mock_planet_model.add_planet_to_system.assert_called_once_with(999001, planet_data)
+        self.assertEqual(self.mock_planet_model.add_planet_to_system.call_args_list, [call(999001, planet_data)])
         self.assertTrue(result)
 
 
-class TestMapController(BaseTestCase):
+@unittest.skipIf(MapController is None, "MapController not available")
+class TestMapController(ControllerTestMixin, BaseTestCase):
     """Test map controller functionality"""
     
-    @patch('models.star_model.StarModel')
-    @patch('models.nation_model.NationModel')
-    @patch('galactic_directions.get_galactic_directions')
-    def setUp(self, mock_galactic_directions, mock_nation_model, mock_star_model):
-        super().setUp()
-        
-        self.mock_star_model = MagicMock()
-        self.mock_nation_model = MagicMock()
-        self.mock_galactic_directions = MagicMock()
-        
-        mock_star_model.return_value = self.mock_star_model
-        mock_nation_model.return_value = self.mock_nation_model
-        mock_galactic_directions.return_value = []
-        
-        try:
-            from controllers.map_controller import MapController
-            self.map_controller = MapController()
-        except ImportError:
-            self.skipTest("MapController not available")
+    controller_cls = MapController
+    controller_attr = 'map_controller'
+    model_patches = {
+        'mock_star_model': 'models.star_model.StarModel',
+        'mock_nation_model': 'models.nation_model.NationModel',
+    }
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        _start_class_patch(cls, 'galactic_directions.get_galactic_directions').return_value = []
     
     def test_get_filtered_stars(self):
         """Test getting filtered stars for map display"""
@@ -386,21 +394,15 @@ class TestMapController(BaseTestCase):
         self.assertIsNotNone(result)
 
 
-class TestStellarRegionController(BaseTestCase):
+@unittest.skipIf(StellarRegionController is None, "StellarRegionController not available")
+class TestStellarRegionController(ControllerTestMixin, BaseTestCase):
     """Test stellar region controller functionality"""
     
-    @patch('models.stellar_region_model.StellarRegionModel')
-    def setUp(self, mock_region_model):
-        super().setUp()
-        
-        self.mock_region_model = MagicMock()
-        mock_region_model.return_value = self.mock_region_model
-        
-        try:
-            from controllers.stellar_region_controller import StellarRegionController
-            self.region_controller = StellarRegionController()
-        except ImportError:
-            self.skipTest("StellarRegionController not available")
+    controller_cls = StellarRegionController
+    controller_attr = 'region_controller'
+    model_patches = {
+        'mock_region_model': 'models.stellar_region_model.StellarRegionModel',
+    }
     
     def test_get_all_regions(self):
         """Test getting all stellar regions through controller"""
@@ -415,7 +417,7 @@ class TestStellarRegionController(BaseTestCase):
         
         result = self.region_controller.get_all_regions()
         
-        self.mock_region_model.get_all_regions.assert_called_once()
+        self.assertEqual(self.mock_region_model.get_all_regions.call_count, 1)
         self.assertEqual(len(result), 1)
     
     def test_find_region_for_coordinates(self):
@@ -428,7 +430,7 @@ class TestStellarRegionController(BaseTestCase):
         
         result = self.region_controller.find_region_for_coordinates(0, 0, 0)
         
-        self.mock_region_model.find_region_for_coordinates.assert_called_once_with(0, 0, 0)
+        self.assertEqual(self.mock_region_model.find_region_for_coordinates.call_args_list, [call(0, 0, 0)])
         self.assertEqual(result['name'], 'Sol Region')
     
     def test_get_region_statistics(self):
@@ -437,102 +439,71 @@ class TestStellarRegionController(BaseTestCase):
             'total_regions': 8,
             'largest_region': 'Sol Region'
         }
-        self.mock_region_model.get_statistics.return_value = mock_stats
+        self.mock_region_model.get_statistics = lambda: mock_stats
         
         result = self.region_controller.get_region_statistics()
         
         self.assertEqual(result['total_regions'], 8)
 
 
-class TestControllerPerformance(BaseTestCase):
+@unittest.skipIf(StarController is None, "StarController not available")
+class TestControllerPerformance(ControllerTestMixin, BaseTestCase):
     """Test controller performance characteristics"""
     
-    @patch('models.star_model.StarModel')
-    def test_star_controller_performance(self, mock_star_model):
-        """Test star controller performance with large datasets"""
-        # Mock large dataset
-        large_dataset = [{'id': i, 'name': f'Star {i}'} for i in range(10000)]
-        
-        mock_model = MagicMock()
-        mock_model.get_all_stars.return_value = large_dataset
-        mock_star_model.return_value = mock_model
-        
-        try:
-            from controllers.star_controller import StarController
-            controller = StarController()
-            
-            def large_query_test():
-                return controller.get_all_stars()
-            
-            result = self.assertPerformance(large_query_test, max_time_ms=2000)
-            self.assertEqual(len(result), 10000)
-            
-        except ImportError:
-            self.skipTest("StarController not available")
-    
-    @patch('models.star_model.StarModel')
-    def test_search_performance(self, mock_star_model):
-        """Test search performance through controller"""
-        mock_results = [{'id': 1, 'name': 'Found Star'}]
-        
-        mock_model = MagicMock()
-        mock_model.search_stars.return_value = mock_results
-        mock_star_model.return_value = mock_model
-        
-        try:
-            from controllers.star_controller import StarController
-            controller = StarController()
-            
-            def search_test():
-                return controller.search_stars('test query')
-            
-            result = self.assertPerformance(search_test, max_time_ms=1000)
-            self.assertEqual(len(result), 1)
-            
-        except ImportError:
-            self.skipTest("StarController not available")
+    controller_cls = StarController
+    controller_attr = 'star_controller'
+    model_patches = {
+        'mock_star_model': 'models.star_model.StarModel',
+    }
+    
+    def test_star_controller_performance(self):
+        """Test star controller query and search performance"""
+        # (method, call args, model result, time limit in ms)
+        cases = (
+            ('get_all_stars', (), _LARGE_STAR_DATASET, 2000),
+            ('search_stars', ('test query',), [{'id': 1, 'name': 'Found Star'}], 1000),
+        )
+        
+        for method, args, model_result, max_time_ms in cases:
+            with self.subTest(method=method):
+                getattr(self.mock_star_model, method).return_value = model_result
+                
+                result = self.assertPerformance(
+                    lambda: getattr(self.star_controller, method)(*args),
+                    max_time_ms=max_time_ms
+                )
+                self.assertEqual(len(result), len(model_result))
 
 
-class TestControllerValidation(BaseTestCase):
+@unittest.skipIf(StarController is None, "StarController not available")
+class TestControllerValidation(ControllerTestMixin, BaseTestCase):
     """Test controller input validation"""
     
-    @patch('models.star_model.StarModel')
-    def setUp(self, mock_star_model):
-        super().setUp()
-        
-        self.mock_star_model = MagicMock()
-        mock_star_model.return_value = self.mock_star_model
-        
-        try:
-            from controllers.star_controller import StarController
-            self.star_controller = StarController()
-        except ImportError:
-            self.skipTest("StarController not available")
-    
-    def test_invalid_star_id(self):
-        """Test handling of invalid star IDs"""
-        self.mock_star_model.get_star_by_id.return_value = None
-        
-        result = self.star_controller.get_star_by_id(-1)
-        
-        self.assertIsNone(result)
-    
-    def test_invalid_magnitude_range(self):
-        """Test handling of invalid magnitude ranges"""
-        # Test with invalid range (min > max)
-        result = self.star_controller.filter_stars_by_magnitude(min_mag=5, max_mag=0)
-        
-        # Should handle gracefully or return empty result
-        self.assertIsInstance(result, list)
-    
-    def test_empty_search_query(self):
-        """Test handling of empty search queries"""
-        self.mock_star_model.search_stars.return_value = []
-        
-        result = self.star_controller.search_stars('')
+    controller_cls = StarController
+    controller_attr = 'star_controller'
+    model_patches = {
+        'mock_star_model': 'models.star_model.StarModel',
+    }
+    
+    def test_invalid_inputs_handled(self):
+        """Test handling of invalid IDs, magnitude ranges and search queries"""
+        # (controller method, args, kwargs, model method to stub, model result, check)
+        cases = (
+            ('get_star_by_id', (-1,), {}, 'get_star_by_id', None,
+             self.assertIsNone),
+            # Invalid range (min > max) should be handled gracefully
+            ('filter_stars_by_magnitude', (), {'min_mag': 5, 'max_mag': 0}, None, None,
+             lambda result: self.assertIsInstance(result, list)),
+            ('search_stars', ('',), {}, 'search_stars', [],
+             lambda result: self.assertEqual(len(result), 0)),
+        )
         
-        self.assertEqual(len(result), 0)
-
+        for method, args, kwargs, model_method, model_result, check in cases:
+            with self.subTest(method=method):
+                if model_method:
+                    getattr(self.mock_star_model, model_method).return_value = model_result
+                
+                check(getattr(self.star_controller, method)(*args, **kwargs))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -272,6 +272,72 @@ class TestTemplateWorkflow(BaseTestCase):
             
         except ImportError:
             self.skipTest("DataManager not available")
+    
+    def test_bulk_star_template_matches_single(self):
+        """Test bulk star creation produces the same records as the single-star template"""
+        import numpy as np
+        from templates.data_templates import StarTemplate
+        
+        xyz = np.array([[45.2, -23.1, 67.8], [-12.0, 3.5, 8.25]])
+        bulk = StarTemplate.create_basic_stars_bulk(
+            [999101, 999102], ['Bulk One', 'Bulk Two'], xyz, [4.2, 6.1], ['G5V', 'K2III']
+        ).to_dict('records')
+        
+        for record, (star_id, name, (x, y, z), mag, spect) in zip(bulk, [
+            (999101, 'Bulk One', xyz[0], 4.2, 'G5V'),
+            (999102, 'Bulk Two', xyz[1], 6.1, 'K2III'),
+        ]):
+            single = StarTemplate.create_basic_star(star_id, name, x, y, z, mag, spect).as_dict()
+            self.assertEqual(list(record), list(single))
+            self.assertAlmostEqual(record.pop('dist'), single.pop('dist'))
+            self.assertEqual(record, single)
+            self.assertValidStarData(record)
+    
+    def test_bulk_region_template_matches_single(self):
+        """Test bulk region creation produces the same definitions as the single-region template"""
+        import numpy as np
+        from templates.data_templates import StellarRegionTemplate
+        
+        bounds = np.array([[-10.0, 5.0, 0.0, 3.5, -2.0, 2.0], [1.0, 2.0, 3.0, 4.0, 5.0, 60.0]])
+        bulk = StellarRegionTemplate.create_stellar_regions_bulk(
+            ['Test Reach', 'Test Expanse'], ['TR', 'TE'], bounds
+        )
+        single = [
+            StellarRegionTemplate.create_stellar_region('Test Reach', 'TR', *bounds[0].tolist()),
+            StellarRegionTemplate.create_stellar_region('Test Expanse', 'TE', *bounds[1].tolist())
+        ]
+        
+        self.assertEqual(bulk, single)
+        self.assertEqual(bulk[1]['diameter'], 55.0)
+    
+    def test_template_records_copy_and_pickle(self):
+        """Test frozen template records survive copy, deepcopy and pickle"""
+        import copy
+        import pickle
+        from templates.data_templates import (
+            StarTemplate, NationTemplate, TradeRouteTemplate, PlanetarySystemTemplate
+        )
+        
+        records = [
+            StarTemplate.create_basic_star(999201, 'Copy Star', 1.0, 2.0, 3.0, 4.5, 'G2V'),
+            NationTemplate.create_nation(
+                'copy_nation', 'Copy Nation', 'The Copy Nation', 'Republic',
+                'Copy System', 999201, 'Copy Prime', 2400
+            ),
+            TradeRouteTemplate.create_passenger_route(
+                'Copy Express', 'Copy System', 999201, 'Paste System', 999202, 'copy_nation'
+            ),
+            PlanetarySystemTemplate.create_planet('Copy I', 'Terrestrial', 0.8, 0.9, 0.95, 260, 300),
+            PlanetarySystemTemplate.create_habitable_world('Copy II', 1.1, inhabited=True, population=1000),
+            PlanetarySystemTemplate.create_gas_giant('Copy III', 5.0, 300, 11, moon_count=12)
+        ]
+        
+        for record in records:
+            for clone in (copy.copy(record), copy.deepcopy(record),
+                          pickle.loads(pickle.dumps(record))):
+                self.assertIs(type(clone), type(record))
+                self.assertEqual(clone, record)
+                self.assertEqual(clone.as_dict(), record.as_dict())
 
 
 class TestFelgenlandCleanupWorkflow(BaseTestCase):
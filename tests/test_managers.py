@@ -86,6 +86,30 @@ class TestDataManager(BaseTestCase):
         self.mock_star_manager.add_star.assert_called_once()
         self.assertEqual(result, 999001)
     
+    def test_add_nation_accepts_template_record(self):
+        """Test template records are passed to the nation manager as dicts"""
+        from templates.data_templates import NationTemplate
+        
+        nation = NationTemplate.create_nation(
+            nation_id='test_nation',
+            name='Test Nation',
+            full_name='The Test Nation',
+            government_type='Republic',
+            capital_system='Test System',
+            capital_star_id=999001,
+            capital_planet='Test Prime',
+            established_year=2400
+        )
+        self.mock_nation_manager.add_nation.return_value = 'test_nation'
+        
+        result = self.data_manager.add_nation(nation)
+        
+        self.mock_nation_manager.add_nation.assert_called_once_with(nation.as_dict())
+        nation_data = self.mock_nation_manager.add_nation.call_args[0][0]
+        self.assertIsInstance(nation_data, dict)
+        self.assertIn('name', nation_data)
+        self.assertEqual(result, 'test_nation')
+    
     def test_get_comprehensive_statistics(self):
         """Test getting comprehensive statistics"""
         # Mock statistics from each manager
@@ -133,6 +133,85 @@ class TestStarModel(BaseTestCase):
         distance = self.star_model.calculate_distance(0, 71456)  # Sol to Alpha Centauri
         self.assertGreater(distance, 0)
         self.assertLess(distance, 10)  # Should be about 4.37 light years
+    
+    def test_nation_summary_is_read_only(self):
+        """Test shared nation summaries can't be mutated and display data gets copies"""
+        data = self.star_model.data
+        summary = data.loc[data['id'] == 0, 'nation'].iloc[0]
+        with self.assertRaises(TypeError):
+            summary['name'] = 'Changed'
+        
+        stars = {star['id']: star for star in self.star_model.get_stars_for_display()}
+        sol_nation, alpha_cen_nation = stars[0]['nation'], stars[71456]['nation']
+        self.assertIsInstance(sol_nation, dict)
+        self.assertEqual(sol_nation, dict(summary))
+        
+        sol_nation['name'] = 'Changed'
+        self.assertNotEqual(alpha_cen_nation['name'], 'Changed')
+        self.assertNotEqual(summary['name'], 'Changed')
+
+
+class TestStarNamingSystem(BaseTestCase):
+    """Test the star naming system"""
+    
+    def setUp(self):
+        super().setUp()
+        
+        self.catalog = pd.DataFrame({
+            'id': [32263, 70666, 71453, 118720, 5],
+            'proper': ['Sirius', 'Proxima Centauri', 'Toliman', None, None],
+            'bayer': ['Alp', None, 'Alp-2', None, None],
+            'flam': [9.0, None, None, None, None],
+            'con': ['CMa', 'Cen', 'Cen', 'Leo', 'Null'],
+            'bf': ['9Alp CMa', None, 'Alp2Cen', None, None],
+            'hip': [32349.0, 70890.0, 71681.0, None, None],
+            'gl': ['Gl 244A', 'Gl 551', 'Gl 559B', 'Gl 406', None],
+            'hd': [48915.0, None, 128621.0, None, None],
+            'var': [None, 'V645', None, None, None],
+            'comp': [1, 1, 2, 1, 1]
+        })
+        
+        try:
+            from star_naming import StarNamingSystem
+            self.naming_system = StarNamingSystem()
+        except ImportError:
+            self.skipTest("StarNamingSystem not available")
+    
+    def test_process_matches_per_row_naming(self):
+        """Test that batch naming agrees with generate_star_name"""
+        processed = self.naming_system.process_star_dataframe(self.catalog.copy())
+        
+        for (_, star_row), (_, named_row) in zip(self.catalog.iterrows(), processed.iterrows()):
+            expected = self.naming_system.generate_star_name(star_row)
+            for key, value in expected.items():
+                self.assertEqual(named_row[key], value, f"{key} differs for star {star_row['id']}")
+    
+    def test_search_uses_precomputed_names(self):
+        """Test searching by name over a processed catalog"""
+        processed = self.naming_system.process_star_dataframe(self.catalog.copy())
+        
+        results = self.naming_system.search_stars_by_name(processed, 'HIP 70890')
+        self.assertEqual(list(results['id']), [70666])
+        
+        results = self.naming_system.search_stars_by_name(processed, 'gliese')
+        self.assertEqual(len(results), 4)
+    
+    def test_star_model_search_blob(self):
+        """Test StarModel keeps its name search text out of the star data"""
+        try:
+            from models.star_model import StarModel
+        except ImportError:
+            self.skipTest("StarModel not available")
+        
+        model = StarModel.__new__(StarModel)
+        model.naming_system = self.naming_system
+        model.data = self.naming_system.process_star_dataframe(self.catalog.copy())
+        model._build_search_blob()
+        
+        self.assertNotIn('_search_blob', model.data.columns)
+        
+        results = self.naming_system.search_stars_by_name(model.data, 'HIP 70890', model._search_blob)
+        self.assertEqual(list(results['id']), [70666])
 
 
 class TestStarModelDB(BaseTestCase):